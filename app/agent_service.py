@@ -6,14 +6,41 @@ import httpx
 import os
 import asyncio
 from typing import List, Dict, Any, Optional, Callable
-import json
 import logging
 from datetime import datetime
 import uuid
+import secrets
+import itertools
+import time
+import re
+import functools
+from collections import OrderedDict, defaultdict, deque
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson when installed, otherwise fall back to the stdlib encoder
+try:
+    import orjson
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_default(obj: Any):
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode()
+
+    _loads = json.loads
+
 # External agent providers
 AGENT_PROVIDERS = [
     {"name": "agent-zero", "url": os.getenv("AGENT_ZERO_URL", "http://agent-zero:8003")},
@@ -23,6 +50,65 @@ AGENT_PROVIDERS = [
 # Agent storage
 AGENTS_DIR = Path("/app/data/agents")
 AGENTS_DIR.mkdir(parents=True, exist_ok=True)
+AGENTS_INDEX = AGENTS_DIR / "index.json"
+
+# Task IDs: per-process nonce plus a monotonic counter (agent IDs stay uuid4)
+_PROC_NONCE = secrets.token_hex(4)
+_task_seq = itertools.count()
+
+# Provider circuit breaker: skip a provider for a cooldown after repeated failures
+PROVIDER_FAILURE_THRESHOLD = 3
+PROVIDER_COOLDOWN_SECONDS = 30.0
+
+# Tasks kept in memory; older entries remain available on disk only
+MAX_IN_MEMORY_TASKS = 10_000
+
+# Per-agent bound on retained thought processes
+CONVERSATION_HISTORY_LIMIT = 256
+
+# Shared HTTP client so provider calls reuse pooled keep-alive connections
+_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide provider client, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=2.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300)
+        )
+    return _client
+
+async def close_http_client():
+    """Close the shared provider client (called on gateway shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def _dump_json(path: Path, obj: Any):
+    """Serialize obj and write it in a single call"""
+    path.write_bytes(_dumps(obj, indent=True))
+
+def _replace_bytes(path: Path, data: bytes):
+    """Atomically replace path with data via a temp file and os.replace"""
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+# Keyword stems, matched against the lowercased task in one precompiled pass
+# each; inflections and compounds (redeployed, monitoring, webservers) match too
+_DEPLOY_PLAN_RE = re.compile(r"\b(?:re)?deploy\w*")
+_MONITOR_PLAN_RE = re.compile(r"\bmonitor\w*")
+_BACKUP_PLAN_RE = re.compile(r"\bbackup\w*")
+_INFRA_RE = re.compile(r"\b(?:re)?deploy\w*|\binfrastructure\w*|server\w*")
+_SEARCH_RE = re.compile(r"\b(?:re)?search\w*|\bfind\w*")
+_VIRT_RE = re.compile(r"proxmox\w*|\b[kq]?vms?\b|\bvmware\w*|container\w*")
+
+# Tool groups selected by the stems above
+_DEPLOY_TOOLS = ("ansible", "terraform", "ssh")
+_SEARCH_TOOLS = ("web_search", "rag")
+_VIRT_TOOLS = ("proxmoxer", "ssh")
 
 class Agent:
     def __init__(self, agent_id: str, name: str, capabilities: List[str], model: str = "gpt-4"):
@@ -31,71 +117,111 @@ class Agent:
         self.capabilities = capabilities
         self.model = model
         self.memory = {}
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=CONVERSATION_HISTORY_LIMIT)
         self.tools = {}
+        # Precomputed for fitness scoring
+        self._capabilities_lower = tuple(c.lower() for c in capabilities)
+        # Outcomes of the last CONVERSATION_HISTORY_LIMIT builtin runs and how
+        # many of them succeeded, so the success ratio tracks recent history
+        self._outcomes: deque = deque(maxlen=CONVERSATION_HISTORY_LIMIT)
+        self._success_count = 0
+        # Pre-serialized agent_config spliced into every provider payload
+        self._config_bytes = _dumps({"name": name, "capabilities": capabilities, "model": model})
         
-    async def think(self, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def think(self, task: str, context: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
         """Agent thinking/reasoning process"""
+        now = now or datetime.now()
+        task_lower = task.lower()
         thought_process = {
             "task": task,
             "context": context,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "agent_id": self.agent_id,
             "reasoning": f"Analyzing task: {task}",
-            "plan": self._create_plan(task, context),
-            "tools_needed": self._identify_tools(task)
+            "plan": self._create_plan(task_lower, context),
+            "tools_needed": self._identify_tools(task_lower)
         }
         
         self.conversation_history.append(thought_process)
         return thought_process
     
-    def _create_plan(self, task: str, context: Dict[str, Any]) -> List[str]:
-        """Create execution plan for the task"""
+    def _record_outcome(self, success: bool) -> None:
+        """Add a run outcome to the bounded success window"""
+        if len(self._outcomes) == self._outcomes.maxlen:
+            self._success_count -= self._outcomes[0]
+        self._outcomes.append(success)
+        self._success_count += success
+    
+    def _create_plan(self, task_lower: str, context: Dict[str, Any]) -> List[str]:
+        """Create execution plan for the lowercased task"""
         # Basic planning logic - would be enhanced with LLM
-        if "deploy" in task.lower():
+        if _DEPLOY_PLAN_RE.search(task_lower):
             return ["analyze_requirements", "prepare_deployment", "execute_deployment", "verify_deployment"]
-        elif "monitor" in task.lower():
+        elif _MONITOR_PLAN_RE.search(task_lower):
             return ["setup_monitoring", "collect_metrics", "analyze_data", "generate_report"]
-        elif "backup" in task.lower():
+        elif _BACKUP_PLAN_RE.search(task_lower):
             return ["identify_data", "prepare_backup", "execute_backup", "verify_backup"]
         else:
             return ["understand_task", "gather_information", "execute_action", "verify_result"]
     
-    def _identify_tools(self, task: str) -> List[str]:
-        """Identify tools needed for the task"""
+    def _identify_tools(self, task_lower: str) -> List[str]:
+        """Identify tools needed for the lowercased task"""
         tools = []
-        if any(word in task.lower() for word in ["deploy", "infrastructure", "server"]):
-            tools.extend(["ansible", "terraform", "ssh"])
-        if any(word in task.lower() for word in ["search", "find", "research"]):
-            tools.extend(["web_search", "rag"])
-        if any(word in task.lower() for word in ["proxmox", "vm", "container"]):
-            tools.extend(["proxmoxer", "ssh"])
+        if _INFRA_RE.search(task_lower):
+            tools.extend(_DEPLOY_TOOLS)
+        if _SEARCH_RE.search(task_lower):
+            tools.extend(_SEARCH_TOOLS)
+        if _VIRT_RE.search(task_lower):
+            tools.extend(_VIRT_TOOLS)
         return tools
 
 class AgentOrchestrator:
     def __init__(self):
         self.agents = {}
-        self.tasks = {}
+        self.tasks: OrderedDict[str, Dict[str, Any]] = OrderedDict()
         self.providers = AGENT_PROVIDERS
+        self._pending_writes: set[asyncio.Task] = set()
+        # Number of entries in self.tasks per agent, maintained as tasks are logged
+        # and evicted so list_agents doesn't rescan every task
+        self._active_by_agent: Dict[str, int] = defaultdict(int)
+        # provider name -> (consecutive failures, monotonic time it is blocked until)
+        self._provider_state: Dict[str, tuple[int, float]] = {}
+        # Bumped whenever the agent set changes so cached capability scores go stale
+        self._agents_version = 0
+        self._select_cached = functools.lru_cache(maxsize=1024)(self._capability_scores)
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._index_lock = asyncio.Lock()
+        self._load_index()
+    
+    def _load_index(self):
+        """Restore agents from the on-disk index in a single read"""
+        try:
+            self._index = _loads(AGENTS_INDEX.read_bytes())
+        except FileNotFoundError:
+            return
+        except ValueError as e:
+            logger.error(f"Corrupt agent index {AGENTS_INDEX}: {e}")
+            return
+        for agent_id, info in self._index.items():
+            self.agents[agent_id] = Agent(agent_id, info["name"], info["capabilities"], info["model"])
+        self._agents_version += 1
         
     async def create_agent(self, name: str, capabilities: List[str], model: str = "gpt-4") -> str:
         """Create a new agent"""
         agent_id = str(uuid.uuid4())
         agent = Agent(agent_id, name, capabilities, model)
         self.agents[agent_id] = agent
+        self._agents_version += 1
         
-        # Save agent to disk
-        agent_data = {
-            "agent_id": agent_id,
+        # Save agent to the on-disk index
+        self._index[agent_id] = {
             "name": name,
             "capabilities": capabilities,
             "model": model,
-            "created_at": datetime.now().isoformat()
+            "created_at": datetime.now()
         }
-        
-        agent_file = AGENTS_DIR / f"{agent_id}.json"
-        with open(agent_file, 'w') as f:
-            json.dump(agent_data, f, indent=2)
+        async with self._index_lock:
+            await asyncio.to_thread(_replace_bytes, AGENTS_INDEX, _dumps(self._index))
         
         logger.info(f"Created agent {name} with ID {agent_id}")
         return agent_id
@@ -109,13 +235,14 @@ class AgentOrchestrator:
                 "name": agent.name,
                 "capabilities": agent.capabilities,
                 "model": agent.model,
-                "active_tasks": len([t for t in self.tasks.values() if t.get("agent_id") == agent_id])
+                "active_tasks": self._active_by_agent.get(agent_id, 0)
             })
         
         return {"agents": agents_info}
     
     async def delegate_task(self, task: str, context: Dict[str, Any], agent_id: Optional[str] = None) -> Dict[str, Any]:
         """Delegate a task to an agent or auto-select the best agent"""
+        now = datetime.now()
         try:
             # Auto-select agent if not specified
             if not agent_id:
@@ -133,103 +260,162 @@ class AgentOrchestrator:
             
             agent = self.agents[agent_id]
             
-            # Try external providers first
-            for provider in self.providers:
-                try:
-                    async with httpx.AsyncClient(timeout=60.0) as client:
-                        resp = await client.post(
-                            f"{provider['url']}/execute",
-                            json={
-                                "task": task,
-                                "context": context,
-                                "agent_config": {
-                                    "name": agent.name,
-                                    "capabilities": agent.capabilities,
-                                    "model": agent.model
-                                }
-                            }
-                        )
-                        if resp.status_code == 200:
-                            result = resp.json()
-                            await self._log_task_execution(agent_id, task, context, result, provider["name"])
-                            return {"status": "success", "provider": provider["name"], "result": result}
-                except Exception as e:
-                    logger.warning(f"Provider {provider['name']} failed: {e}")
-                    continue
+            # Race all external providers; first 200 wins and the rest are cancelled
+            payload = b"".join((
+                b'{"task":', _dumps(task),
+                b',"context":', _dumps(context),
+                b',"agent_config":', agent._config_bytes, b"}"
+            ))
+            probes = [
+                asyncio.create_task(self._call_provider(provider, payload))
+                for provider in self.providers
+                if not self._provider_blocked(provider)
+            ]
+            try:
+                for probe in asyncio.as_completed(probes):
+                    provider, resp = await probe
+                    if resp is not None and resp.status_code == 200:
+                        result = _loads(resp.content)
+                        await self._log_task_execution(agent_id, task, context, result, provider["name"], now)
+                        return {"status": "success", "provider": provider["name"], "result": result}
+            finally:
+                for probe in probes:
+                    probe.cancel()
             
             # Fallback: built-in agent execution
-            result = await self._execute_task_builtin(agent, task, context)
-            await self._log_task_execution(agent_id, task, context, result, "builtin")
+            result = await self._execute_task_builtin(agent, task, context, now)
+            await self._log_task_execution(agent_id, task, context, result, "builtin", now)
             return {"status": "success", "provider": "builtin", "result": result}
             
         except Exception as e:
             logger.error(f"Task delegation failed: {e}")
             return {"status": "error", "message": str(e)}
     
+    async def _call_provider(self, provider: Dict[str, str], payload: bytes):
+        """POST a pre-serialized task to one external provider, returning (provider, response or None)"""
+        try:
+            resp = await get_http_client().post(
+                f"{provider['url']}/execute",
+                content=payload,
+                headers={"content-type": "application/json"}
+            )
+        except (httpx.ConnectError, httpx.TimeoutException) as e:
+            # Provider is unreachable; count towards the breaker
+            self._mark_provider_failure(provider)
+            logger.warning(f"Provider {provider['name']} unreachable: {e}")
+            return provider, None
+        except Exception as e:
+            logger.warning(f"Provider {provider['name']} failed: {e}")
+            return provider, None
+        
+        if resp.status_code >= 500:
+            self._mark_provider_failure(provider)
+        elif resp.status_code < 400:
+            self._provider_state.pop(provider["name"], None)
+        return provider, resp
+    
+    def _provider_blocked(self, provider: Dict[str, str]) -> bool:
+        """Check whether a provider is in its circuit-breaker cooldown"""
+        state = self._provider_state.get(provider["name"])
+        return state is not None and time.monotonic() < state[1]
+    
+    def _mark_provider_failure(self, provider: Dict[str, str]):
+        """Record a retryable failure, opening the breaker once the threshold is hit"""
+        failures = self._provider_state.get(provider["name"], (0, 0.0))[0] + 1
+        unblock_at = 0.0
+        if failures >= PROVIDER_FAILURE_THRESHOLD:
+            unblock_at = time.monotonic() + PROVIDER_COOLDOWN_SECONDS
+            logger.warning(f"Provider {provider['name']} disabled for {PROVIDER_COOLDOWN_SECONDS}s after {failures} failures")
+        self._provider_state[provider["name"]] = (failures, unblock_at)
+    
     async def _select_best_agent(self, task: str, context: Dict[str, Any]) -> Optional[str]:
         """Select the best agent for a task based on capabilities"""
+        # Key on the lowercased text as-is: reordering words would break
+        # multi-word capabilities such as "code review"
+        capability_scores = self._select_cached(self._agents_version, task.lower())
         best_agent_id = None
         best_score = 0
         
-        for agent_id, agent in self.agents.items():
-            score = self._calculate_agent_fitness(agent, task, context)
+        # Success history changes on every task, so it is scored live rather than
+        # cached. It only breaks ties between agents with a matching capability:
+        # an agent with none is never selected, however often it has succeeded
+        for agent_id, capability_score in capability_scores:
+            agent = self.agents.get(agent_id)
+            if agent is None or capability_score <= 0:
+                continue
+            score = capability_score + self._success_score(agent)
             if score > best_score:
                 best_score = score
                 best_agent_id = agent_id
         
         return best_agent_id
     
+    def _capability_scores(self, version: int, task_lower: str) -> tuple[tuple[str, float], ...]:
+        """Capability score of every agent for the task; memoized per (agent set version, task)"""
+        return tuple(
+            (agent_id, self._calculate_agent_fitness(agent, task_lower, {}))
+            for agent_id, agent in self.agents.items()
+        )
+    
     def _calculate_agent_fitness(self, agent: Agent, task: str, context: Dict[str, Any]) -> float:
-        """Calculate how well an agent fits a task"""
+        """Calculate how well an agent's capabilities fit a task"""
         score = 0.0
         task_lower = task.lower()
         
         # Score based on capabilities
-        for capability in agent.capabilities:
-            if capability.lower() in task_lower:
+        for capability in agent._capabilities_lower:
+            if capability in task_lower:
                 score += 1.0
         
-        # Score based on previous success (simplified)
-        successful_tasks = len([h for h in agent.conversation_history if h.get("success", False)])
-        total_tasks = len(agent.conversation_history)
-        if total_tasks > 0:
-            score += (successful_tasks / total_tasks) * 0.5
-        
         return score
     
-    async def _execute_task_builtin(self, agent: Agent, task: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _success_score(self, agent: Agent) -> float:
+        """Score based on success over the agent's recent runs (simplified)"""
+        if agent._outcomes:
+            return (agent._success_count / len(agent._outcomes)) * 0.5
+        return 0.0
+    
+    async def _execute_task_builtin(self, agent: Agent, task: str, context: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
         """Execute task using built-in agent logic"""
+        now = now or datetime.now()
         # Agent thinks about the task
-        thought_process = await agent.think(task, context)
+        thought_process = await agent.think(task, context, now)
+        
+        # Execute the plan; steps are independent so run them concurrently
+        step_results = await asyncio.gather(
+            *[self._execute_step(step, task, context, agent, now) for step in thought_process["plan"]],
+            return_exceptions=True
+        )
+        execution_results = [
+            {"step": step, "success": False, "error": str(r)} if isinstance(r, Exception) else r
+            for step, r in zip(thought_process["plan"], step_results)
+        ]
         
-        # Execute the plan
-        execution_results = []
-        for step in thought_process["plan"]:
-            step_result = await self._execute_step(step, task, context, agent)
-            execution_results.append(step_result)
+        success = all(r.get("success", False) for r in execution_results)
+        agent._record_outcome(success)
         
         return {
             "task": task,
             "agent": agent.name,
             "thought_process": thought_process,
             "execution_results": execution_results,
-            "success": all(r.get("success", False) for r in execution_results),
-            "timestamp": datetime.now().isoformat()
+            "success": success,
+            "timestamp": now
         }
     
-    async def _execute_step(self, step: str, task: str, context: Dict[str, Any], agent: Agent) -> Dict[str, Any]:
+    async def _execute_step(self, step: str, task: str, context: Dict[str, Any], agent: Agent, now: Optional[datetime] = None) -> Dict[str, Any]:
         """Execute a single step in the agent's plan"""
         # This is a simplified step execution - would be enhanced with actual tool calling
         return {
             "step": step,
             "description": f"Executed {step} for task: {task}",
             "success": True,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now or datetime.now()
         }
     
-    async def _log_task_execution(self, agent_id: str, task: str, context: Dict[str, Any], result: Dict[str, Any], provider: str):
+    async def _log_task_execution(self, agent_id: str, task: str, context: Dict[str, Any], result: Dict[str, Any], provider: str, now: Optional[datetime] = None):
         """Log task execution for analysis and learning"""
-        task_id = str(uuid.uuid4())
+        task_id = f"{_PROC_NONCE}-{next(_task_seq)}"
         task_log = {
             "task_id": task_id,
             "agent_id": agent_id,
@@ -237,24 +423,50 @@ class AgentOrchestrator:
             "context": context,
             "result": result,
             "provider": provider,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now or datetime.now()
         }
         
         self.tasks[task_id] = task_log
+        self._active_by_agent[agent_id] += 1
+        while len(self.tasks) > MAX_IN_MEMORY_TASKS:
+            _, evicted = self.tasks.popitem(last=False)
+            self._task_evicted(evicted["agent_id"])
         
-        # Save to disk
-        task_file = AGENTS_DIR / f"task_{task_id}.json"
-        with open(task_file, 'w') as f:
-            json.dump(task_log, f, indent=2)
+        # Save to disk in the background so delegation isn't blocked on file I/O
+        write = asyncio.create_task(asyncio.to_thread(_dump_json, AGENTS_DIR / f"task_{task_id}.json", task_log))
+        self._pending_writes.add(write)
+        write.add_done_callback(self._on_write_done)
+    
+    def _task_evicted(self, agent_id: str):
+        """Keep the per-agent count in step with self.tasks when a task is dropped"""
+        remaining = self._active_by_agent.get(agent_id, 0) - 1
+        if remaining > 0:
+            self._active_by_agent[agent_id] = remaining
+        else:
+            self._active_by_agent.pop(agent_id, None)
+    
+    def _on_write_done(self, write: asyncio.Task):
+        """Release a finished background write and surface any failure"""
+        self._pending_writes.discard(write)
+        if not write.cancelled() and write.exception():
+            logger.error(f"Failed to persist task log: {write.exception()}")
+    
+    def _iter_tasks(self, agent_id: Optional[str] = None):
+        """Yield logged tasks, optionally filtered by agent"""
+        for t in self.tasks.values():
+            if agent_id is None or t.get("agent_id") == agent_id:
+                yield t
+    
+    async def stream_task_history(self, agent_id: Optional[str] = None):
+        """Yield task execution history as NDJSON lines"""
+        # Snapshot first: tasks logged or evicted while the response is being
+        # sent would otherwise mutate self.tasks mid-iteration
+        for t in list(self._iter_tasks(agent_id)):
+            yield _dumps(t) + b"\n"
     
     async def get_task_history(self, agent_id: Optional[str] = None) -> Dict[str, Any]:
         """Get task execution history"""
-        if agent_id:
-            tasks = [t for t in self.tasks.values() if t.get("agent_id") == agent_id]
-        else:
-            tasks = list(self.tasks.values())
-        
-        return {"tasks": tasks}
+        return {"tasks": list(self._iter_tasks(agent_id))}
 
 # Global orchestrator instance
 agent_orchestrator = AgentOrchestrator()
@@ -272,3 +484,6 @@ async def agent_list():
 
 async def agent_history(agent_id: Optional[str] = None):
     return await agent_orchestrator.get_task_history(agent_id)
+
+def agent_history_stream(agent_id: Optional[str] = None):
+    return agent_orchestrator.stream_task_history(agent_id)
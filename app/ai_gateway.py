@@ -6,13 +6,36 @@ FastAPI Gateway for Modular AI Provider Orchestration
 """
 
 from fastapi import FastAPI, Request, HTTPException, Body
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from contextlib import asynccontextmanager
+import asyncio
 import httpx
+import orjson
 import os
-from typing import Dict, Any
+import time
+import functools
+import importlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from urllib.parse import urlsplit
+from typing import Dict, Any, List, Union
 from app.rag_service import rag_retrieve, rag_qa, rag_crawl, rag_add_document, rag_list_documents
-from app.agent_service import agent_act, agent_create, agent_list, agent_history
-from app.orchestration.ansible_module import (run_ansible_playbook, run_ansible_adhoc, 
+from app.gateway_models import (
+    RagRetrieveRequest, RagQaRequest, RagCrawlRequest, RagAddDocumentRequest, AgentActRequest,
+    AgentCreateRequest, OrchestrateAnsiblePlaybookRequest, OrchestrateAnsiblePlaybookBatchRequest,
+    OrchestrateAnsibleAdhocRequest,
+    OrchestrateAnsibleCreatePlaybookRequest, OrchestrateTerraformPlanRequest,
+    OrchestrateTerraformApplyRequest, OrchestrateTerraformDestroyRequest,
+    OrchestrateTerraformWorkspaceRequest, OrchestrateProxmoxConnectRequest,
+    OrchestrateProxmoxVmsRequest, OrchestrateProxmoxCreateVmRequest,
+    OrchestrateProxmoxStartVmRequest, OrchestrateProxmoxStopVmRequest, OrchestrateSshConnectRequest,
+    OrchestrateSshExecuteRequest, OrchestrateSshUploadRequest, OrchestrateSshScriptRequest,
+    OrchestrateSshGenerateKeysRequest, TalosAddNodeRequest, TalosRemoveNodeRequest,
+    MonitoringDeployRequest, SecurityScanRequest, WorkflowExecuteRequest,
+)
+from app.agent_service import agent_act, agent_create, agent_list, agent_history, agent_history_stream, close_http_client
+from app.orchestration.ansible_module import (run_ansible_playbook, run_ansible_playbooks_batch, run_ansible_adhoc, 
                                              create_ansible_playbook, list_ansible_playbooks)
 from app.orchestration.terraform_module import (run_terraform_command, terraform_init, terraform_plan, 
                                                terraform_apply, terraform_destroy, terraform_show_state, 
@@ -24,17 +47,36 @@ from app.orchestration.powershell_module import run_powershell_command
 from app.orchestration.bash_module import run_bash_command
 from app.orchestration.ssh_module import (run_ssh_command, ssh_connect, ssh_execute, ssh_upload_file, 
                                          ssh_execute_script, ssh_generate_keys, ssh_list_connections)
-from app.orchestration.talos_k8s_module import TalosK8sOrchestrator
-from app.orchestration.monitoring_module import MonitoringOrchestrator
-from app.orchestration.database_module import DatabaseOrchestrator
-from app.orchestration.security_scanner_module import SecurityScannerOrchestrator
-from app.orchestration.workflow_module import WorkflowOrchestrator
-# New crypto and financial MCPs
-from app.orchestration.mcp_crypto import CryptoOrchestrator
-from app.orchestration.mcp_revenue_optimization import RevenueOptimizationOrchestrator
-from app.orchestration.mcp_financial_analytics import FinancialAnalyticsOrchestrator
-
-app = FastAPI(title="Consciousness Control Center Gateway")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pooled HTTP/2 clients for upstream proxying, reused across requests
+    limits = httpx.Limits(max_connections=512, max_keepalive_connections=256, keepalive_expiry=60)
+    # The transport retries failed connects once; requests that reached the
+    # upstream are never replayed since the proxied POSTs aren't idempotent
+    app.state.http = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=1),
+        timeout=httpx.Timeout(connect=2.0, read=30.0, write=10.0, pool=5.0)
+    )
+    # Chat completions stream for as long as generation takes, so no read timeout
+    app.state.http_stream = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=1),
+        timeout=httpx.Timeout(connect=2.0, read=None, write=10.0, pool=5.0)
+    )
+    # Bulkheads cap in-flight requests per upstream host
+    app.state.bulkheads = {urlsplit(url).netloc: asyncio.Semaphore(limit) for url, limit in BULKHEAD_LIMITS}
+    app.state.orchestrators = await _load_orchestrators()
+    yield
+    await app.state.http.aclose()
+    await app.state.http_stream.aclose()
+    await close_http_client()
+    for orchestrator in app.state.orchestrators.values():
+        close = getattr(orchestrator, "close", None)
+        if close is not None:
+            await close()
+    POWERSHELL_POOL.shutdown(wait=False, cancel_futures=True)
+
+app = FastAPI(title="Consciousness Control Center Gateway", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Service URLs (set via environment or docker-compose)
 VLLM_URL = os.getenv("VLLM_URL", "http://vllm:8000")
@@ -43,24 +85,316 @@ TTS_URL = os.getenv("TTS_URL", "http://tts:5002")
 STT_URL = os.getenv("STT_URL", "http://stt:5003")
 EMBED_URL = os.getenv("EMBED_URL", "http://embeddings:5004")
 
+# Max concurrent in-flight requests per upstream; unlisted hosts get the default
+BULKHEAD_LIMITS = [(VLLM_URL, 128), (SD_URL, 16), (TTS_URL, 32), (STT_URL, 32), (EMBED_URL, 64)]
+BULKHEAD_DEFAULT_LIMIT = 64
+# How long to wait for a bulkhead slot before moving on to the next provider
+BULKHEAD_ACQUIRE_TIMEOUT = 0.5
+
+def _fallback_urls(env_var: str) -> list:
+    return [u for u in os.getenv(env_var, "").split(",") if u]
+
+# Secondary providers per service, comma-separated in the environment
+VLLM_FALLBACKS = _fallback_urls("VLLM_FALLBACK_URLS")
+SD_FALLBACKS = _fallback_urls("SD_FALLBACK_URLS")
+TTS_FALLBACKS = _fallback_urls("TTS_FALLBACK_URLS")
+STT_FALLBACKS = _fallback_urls("STT_FALLBACK_URLS")
+EMBED_FALLBACKS = _fallback_urls("EMBED_FALLBACK_URLS")
+
+# Headers that describe a single connection and must not be forwarded
+_HOP_BY_HOP = frozenset({
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te",
+    "trailer", "transfer-encoding", "upgrade", "content-length", "host"
+})
+
+_HOP_BY_HOP_RAW = frozenset(h.encode() for h in _HOP_BY_HOP)
+
+def _filter_hop_by_hop(headers) -> Dict[str, str]:
+    """Copy request headers minus hop-by-hop ones; httpx sets Host/Content-Length itself"""
+    return {k: v for k, v in headers.items() if k.lower() not in _HOP_BY_HOP}
+
+# Per-upstream circuit breaker: after BREAKER_TRIP_FAILURES failures within
+# BREAKER_WINDOW seconds the upstream is skipped for BREAKER_RESET_TIMEOUT seconds,
+# then a single half-open trial decides whether it closes again
+BREAKER_TRIP_FAILURES = 5
+BREAKER_WINDOW = 60.0
+BREAKER_RESET_TIMEOUT = 30.0
+
+# Hedging: when the primary is recovering or slow (p95 time-to-headers above the
+# threshold), the first fallback is fired HEDGE_DELAY seconds after the primary
+# and whichever answers first wins
+HEDGE_DELAY = 0.25
+HEDGE_P95_THRESHOLD = 2.0
+HEDGE_MIN_SAMPLES = 20
+
+class BreakerState:
+    def __init__(self):
+        self.state = "closed"
+        self.failures = deque()
+        self.opened_at = 0.0
+        # Set while the one half-open trial request is outstanding
+        self.trial_in_flight = False
+        self.latencies = deque(maxlen=100)
+
+    def p95(self) -> float:
+        if len(self.latencies) < HEDGE_MIN_SAMPLES:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    def allow(self) -> bool:
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < BREAKER_RESET_TIMEOUT:
+                return False
+            self.state = "half_open"
+        if self.state == "half_open":
+            # Everyone else is turned away until the trial settles the state
+            if self.trial_in_flight:
+                return False
+            self.trial_in_flight = True
+        return True
+
+    def abandon_trial(self):
+        """Free the half-open trial when it ends without reaching the upstream"""
+        self.trial_in_flight = False
+
+    def record_success(self):
+        self.state = "closed"
+        self.trial_in_flight = False
+        self.failures.clear()
+
+    def record_failure(self):
+        self.trial_in_flight = False
+        now = time.monotonic()
+        self.failures.append(now)
+        while self.failures and now - self.failures[0] > BREAKER_WINDOW:
+            self.failures.popleft()
+        if self.state == "half_open" or len(self.failures) >= BREAKER_TRIP_FAILURES:
+            self.state = "open"
+            self.opened_at = now
+
+_breakers: Dict[str, BreakerState] = {}
+
+def _breaker_for(url: str) -> BreakerState:
+    host = urlsplit(url).netloc
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = BreakerState()
+    return breaker
+
+# Transport failures (connect/read/write errors, resets, timeouts, protocol
+# errors) make an upstream a candidate for fallback; anything else is a
+# gateway bug and should surface as such
+UPSTREAM_ERRORS = (httpx.TransportError,)
+
+# Request bodies for routes with fallbacks are spooled so every attempt can
+# replay them; small ones stay in memory, larger ones spill to disk
+SPOOL_MAX_MEMORY = 1_048_576
+SPOOL_CHUNK_SIZE = 65536
+
+class _SpooledBody:
+    """Replayable request body; each stream() call reads from the start"""
+    def __init__(self, spool, size: int):
+        self._spool = spool
+        self.size = size
+
+    async def stream(self):
+        # Track our own offset so hedged attempts can read concurrently
+        offset = 0
+        while True:
+            self._spool.seek(offset)
+            chunk = self._spool.read(SPOOL_CHUNK_SIZE)
+            if not chunk:
+                return
+            offset += len(chunk)
+            yield chunk
+
+    def close(self):
+        self._spool.close()
+
+async def _spool_request(request: Request) -> _SpooledBody:
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    size = 0
+    async for chunk in request.stream():
+        spool.write(chunk)
+        size += len(chunk)
+    return _SpooledBody(spool, size)
+
 # Redundancy: fallback to secondary providers if main is unavailable
-async def proxy_with_fallback(request: Request, primary_url: str, fallback_urls: list):
-    async with httpx.AsyncClient() as client:
+async def _send_upstream(client: httpx.AsyncClient, url: str, body: Any, headers: Dict[str, str]) -> httpx.Response:
+    """Forward the request body upstream without buffering the response"""
+    if isinstance(body, _SpooledBody):
+        # Known length, so send Content-Length rather than chunked encoding
+        headers = {**headers, "content-length": str(body.size)}
+        body = body.stream()
+    upstream = client.build_request("POST", url, content=body, headers=headers)
+    return await client.send(upstream, stream=True)
+
+class _BulkheadStream(httpx.AsyncByteStream):
+    """Response stream wrapper that frees its bulkhead slot when the response closes"""
+    def __init__(self, stream: httpx.AsyncByteStream, bulkhead: asyncio.Semaphore):
+        self._stream = stream
+        self._bulkhead = bulkhead
+        self._released = False
+
+    async def __aiter__(self):
         try:
-            resp = await client.post(primary_url, content=await request.body(), headers=request.headers)
-            if resp.status_code == 200:
+            async for chunk in self._stream:
+                yield chunk
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._bulkhead.release()
+
+def _bulkhead_for(bulkheads: Dict[str, asyncio.Semaphore], url: str) -> asyncio.Semaphore:
+    host = urlsplit(url).netloc
+    bulkhead = bulkheads.get(host)
+    if bulkhead is None:
+        bulkhead = bulkheads[host] = asyncio.Semaphore(BULKHEAD_DEFAULT_LIMIT)
+    return bulkhead
+
+async def _try_upstream(client: httpx.AsyncClient, bulkheads: Dict[str, asyncio.Semaphore], url: str,
+                        body: Any, headers: Dict[str, str]):
+    """Attempt one upstream behind its circuit breaker and bulkhead.
+
+    Returns the response unless it is worth trying another provider (transport
+    error, 5xx or 429), in which case None is returned. Other 4xx responses are
+    the caller's fault and are relayed as-is rather than walked to a fallback.
+    """
+    breaker = _breaker_for(url)
+    if not breaker.allow():
+        return None
+    is_trial = breaker.state == "half_open"
+    bulkhead = _bulkhead_for(bulkheads, url)
+    try:
+        await asyncio.wait_for(bulkhead.acquire(), BULKHEAD_ACQUIRE_TIMEOUT)
+    except asyncio.TimeoutError:
+        # Upstream is saturated; let the caller move on to a fallback
+        if is_trial:
+            breaker.abandon_trial()
+        return None
+    except BaseException:
+        if is_trial:
+            breaker.abandon_trial()
+        raise
+    started = time.monotonic()
+    try:
+        resp = await _send_upstream(client, url, body, headers)
+    except UPSTREAM_ERRORS:
+        bulkhead.release()
+        breaker.record_failure()
+        return None
+    except BaseException:
+        # Includes losing a hedged race, which is not the upstream's fault
+        bulkhead.release()
+        if is_trial:
+            breaker.abandon_trial()
+        raise
+    breaker.latencies.append(time.monotonic() - started)
+    # The slot stays held until the (streamed) response is closed
+    resp.stream = _BulkheadStream(resp.stream, bulkhead)
+    if resp.status_code >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    if resp.status_code < 500 and resp.status_code != 429:
+        return resp
+    await resp.aclose()
+    return None
+
+async def _hedged_upstream(client: httpx.AsyncClient, bulkheads: Dict[str, asyncio.Semaphore], primary_url: str,
+                           fallback_url: str, body: Any, headers: Dict[str, str]):
+    """Race the primary against one delayed fallback; returns the first usable response, else None"""
+    primary = asyncio.create_task(_try_upstream(client, bulkheads, primary_url, body, headers))
+    done, pending = await asyncio.wait({primary}, timeout=HEDGE_DELAY)
+    if primary in done and primary.result() is not None:
+        return primary.result()
+    pending.add(asyncio.create_task(_try_upstream(client, bulkheads, fallback_url, body, headers)))
+    winner = None
+    try:
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                resp = task.result()
+                if resp is None:
+                    continue
+                if winner is None:
+                    winner = resp
+                else:
+                    await resp.aclose()
+    finally:
+        for task in pending:
+            task.cancel()
+    return winner
+
+async def proxy_with_fallback(request: Request, client: httpx.AsyncClient, primary_url: str, fallback_urls: list,
+                              body: bytes = None):
+    """Proxy to the primary, then fallbacks; pass body if the handler already read it"""
+    headers = _filter_hop_by_hop(request.headers)
+    spooled = None
+    if body is None:
+        if fallback_urls:
+            # The request stream can't be replayed, so spool it once for all attempts
+            body = spooled = await _spool_request(request)
+        else:
+            # Single attempt: pipe the client's upload straight through
+            body = request.stream()
+            if "content-length" in request.headers:
+                headers["content-length"] = request.headers["content-length"]
+    try:
+        remaining = [primary_url, *fallback_urls]
+        primary = _breaker_for(primary_url)
+        if fallback_urls and (primary.state != "closed" or primary.p95() > HEDGE_P95_THRESHOLD):
+            resp = await _hedged_upstream(client, request.app.state.bulkheads, primary_url, fallback_urls[0], body, headers)
+            if resp is not None:
+                return resp
+            remaining = fallback_urls[1:]
+        for url in remaining:
+            resp = await _try_upstream(client, request.app.state.bulkheads, url, body, headers)
+            if resp is not None:
                 return resp
-        except Exception:
-            pass
-        # Try fallbacks
-        for url in fallback_urls:
-            try:
-                resp = await client.post(url, content=await request.body(), headers=request.headers)
-                if resp.status_code == 200:
-                    return resp
-            except Exception:
-                continue
         raise HTTPException(status_code=503, detail="All providers unavailable.")
+    finally:
+        # Upstream requests are fully sent once response headers are back
+        if spooled is not None:
+            spooled.close()
+
+# Relay chunk size for buffered media/JSON responses (bytes)
+GATEWAY_CHUNK_SIZE = int(os.getenv("GATEWAY_CHUNK_SIZE", "131072"))
+
+class _UpstreamStreamingResponse(StreamingResponse):
+    """StreamingResponse that always closes its upstream response (and so frees its
+    bulkhead slot), even when the client disconnects or the upstream read fails;
+    a BackgroundTask would be skipped in both cases"""
+    def __init__(self, upstream: httpx.Response, **kwargs):
+        super().__init__(**kwargs)
+        self._upstream = upstream
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self._upstream.aclose()
+
+def stream_upstream(resp: httpx.Response, chunk_size: int = GATEWAY_CHUNK_SIZE) -> StreamingResponse:
+    """Relay an upstream streaming response, closing it once sent or abandoned"""
+    response = _UpstreamStreamingResponse(
+        resp,
+        content=resp.aiter_raw(chunk_size=chunk_size),
+        status_code=resp.status_code
+    )
+    # Copy raw header pairs straight across, minus hop-by-hop ones
+    for key, value in resp.headers.raw:
+        key = key.lower()
+        if key not in _HOP_BY_HOP_RAW:
+            response.raw_headers.append((key, value))
+    return response
 
 # Model registry for intelligent selection
 MODEL_REGISTRY = {
@@ -76,78 +410,95 @@ MODEL_REGISTRY = {
     # ...add TTS, STT, embeddings as needed...
 }
 
+# Lookup indices derived once from the registry
+_MODEL_BY_ID = {task: {m["id"]: m for m in models} for task, models in MODEL_REGISTRY.items()}
+_MODELS_BY_PRIORITY = {task: sorted(models, key=lambda m: m["priority"]) for task, models in MODEL_REGISTRY.items()}
+
+# max_tokens is rounded up to this granularity so the selection cache can hit
+_MAX_TOKENS_BUCKET = 512
+
 def select_model(task: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Select the ideal model/provider for the task based on input parameters
     """
-    candidates = MODEL_REGISTRY.get(task, [])
+    model = params.get("model")
+    max_tokens = params.get("max_tokens") or 0
+    return _select_model_cached(
+        task,
+        model if isinstance(model, str) else None,
+        -(-max_tokens // _MAX_TOKENS_BUCKET) if isinstance(max_tokens, int) else 0
+    )
+
+@functools.lru_cache(maxsize=1024)
+def _select_model_cached(task: str, model: str, max_tokens_bucket: int) -> Dict[str, Any]:
     # Example: prefer models with enough max_tokens, or user-specified model
-    if "model" in params:
-        for m in candidates:
-            if m["id"] == params["model"]:
-                return m
+    if model is not None:
+        match = _MODEL_BY_ID.get(task, {}).get(model)
+        if match is not None:
+            return match
+    candidates = _MODELS_BY_PRIORITY.get(task, [])
+    max_tokens = max_tokens_bucket * _MAX_TOKENS_BUCKET
     for m in candidates:
-        if "max_tokens" in m and params.get("max_tokens", 0) <= m["max_tokens"]:
+        if "max_tokens" in m and max_tokens <= m["max_tokens"]:
             return m
     return candidates[0] if candidates else {}
 
 @app.post("/v1/chat/completions")
 @app.post("/v1/completions")
 async def openai_chat(request: Request):
-    body = await request.json()
-    model_info = select_model("chat", body)
+    raw = await request.body()
+    model_info = select_model("chat", orjson.loads(raw))
     provider_url = model_info["provider"] if model_info else VLLM_URL
-    fallback_urls = os.getenv("VLLM_FALLBACK_URLS", "").split(",") if os.getenv("VLLM_FALLBACK_URLS") else []
-    resp = await proxy_with_fallback(request, f"{provider_url}{request.url.path}", fallback_urls)
-    return StreamingResponse(resp.aiter_raw(), status_code=resp.status_code, headers=resp.headers)
-
-@app.post("/v1/images/generations")
-async def image_generation(request: Request):
-    resp = await proxy_with_fallback(request, f"{SD_URL}/v1/images/generations", os.getenv("SD_FALLBACK_URLS", "").split(",") if os.getenv("SD_FALLBACK_URLS") else [])
-    return JSONResponse(content=resp.json(), status_code=resp.status_code)
-
-@app.post("/v1/audio/speech")
-async def tts(request: Request):
-    resp = await proxy_with_fallback(request, f"{TTS_URL}/v1/audio/speech", os.getenv("TTS_FALLBACK_URLS", "").split(",") if os.getenv("TTS_FALLBACK_URLS") else [])
-    return StreamingResponse(resp.aiter_raw(), status_code=resp.status_code, headers=resp.headers)
-
-@app.post("/v1/audio/transcriptions")
-async def stt(request: Request):
-    resp = await proxy_with_fallback(request, f"{STT_URL}/v1/audio/transcriptions", os.getenv("STT_FALLBACK_URLS", "").split(",") if os.getenv("STT_FALLBACK_URLS") else [])
-    return JSONResponse(content=resp.json(), status_code=resp.status_code)
-
-@app.post("/v1/embeddings")
-async def embeddings(request: Request):
-    resp = await proxy_with_fallback(request, f"{EMBED_URL}/v1/embeddings", os.getenv("EMBED_FALLBACK_URLS", "").split(",") if os.getenv("EMBED_FALLBACK_URLS") else [])
-    return JSONResponse(content=resp.json(), status_code=resp.status_code)
+    resp = await proxy_with_fallback(request, request.app.state.http_stream, f"{provider_url}{request.url.path}",
+                                     VLLM_FALLBACKS, body=raw)
+    # Forward SSE tokens as they arrive; a fixed chunk size would hold them back
+    return stream_upstream(resp, chunk_size=None)
+
+# Pass-through endpoints: (route name, path, upstream base URL, fallbacks).
+# The upstream path matches the gateway path.
+PROXY_ROUTES = [
+    ("image_generation", "/v1/images/generations", SD_URL, SD_FALLBACKS),
+    ("tts", "/v1/audio/speech", TTS_URL, TTS_FALLBACKS),
+    ("stt", "/v1/audio/transcriptions", STT_URL, STT_FALLBACKS),
+    ("embeddings", "/v1/embeddings", EMBED_URL, EMBED_FALLBACKS),
+]
+
+def _make_proxy(upstream_url: str, fallback_urls: list):
+    async def proxy(request: Request):
+        resp = await proxy_with_fallback(request, request.app.state.http, upstream_url, fallback_urls)
+        return stream_upstream(resp)
+    return proxy
+
+for name, path, base_url, fallbacks in PROXY_ROUTES:
+    app.post(path, name=name)(_make_proxy(f"{base_url}{path}", fallbacks))
 
 @app.post("/v1/rag/retrieve")
-async def rag_retrieve_endpoint(query: str = Body(...), top_k: int = Body(5)):
-    return await rag_retrieve(query, top_k)
+async def rag_retrieve_endpoint(req: RagRetrieveRequest):
+    return await rag_retrieve(req.query, req.top_k)
 
 @app.post("/v1/rag/qa")
-async def rag_qa_endpoint(document: str = Body(...), question: str = Body(...), context: str = Body(None)):
-    return await rag_qa(document, question, context)
+async def rag_qa_endpoint(req: RagQaRequest):
+    return await rag_qa(req.document, req.question, req.context)
 
 @app.post("/v1/rag/crawl")
-async def rag_crawl_endpoint(url: str = Body(...), depth: int = Body(2)):
-    return await rag_crawl(url, depth)
+async def rag_crawl_endpoint(req: RagCrawlRequest):
+    return await rag_crawl(req.url, req.depth)
 
 @app.post("/v1/rag/add_document")
-async def rag_add_document_endpoint(content: str = Body(...), metadata: dict = Body({})):
-    return await rag_add_document(content, metadata)
+async def rag_add_document_endpoint(req: RagAddDocumentRequest):
+    return await rag_add_document(req.content, req.metadata)
 
 @app.get("/v1/rag/documents")
 async def rag_list_documents_endpoint():
     return await rag_list_documents()
 
 @app.post("/v1/agent/act")
-async def agent_act_endpoint(task: str = Body(...), context: dict = Body({}), agent_id: str = Body(None)):
-    return await agent_act(task, context, agent_id)
+async def agent_act_endpoint(req: AgentActRequest):
+    return await agent_act(req.task, req.context, req.agent_id)
 
 @app.post("/v1/agent/create")
-async def agent_create_endpoint(name: str = Body(...), capabilities: list = Body(...), model: str = Body("gpt-4")):
-    return await agent_create(name, capabilities, model)
+async def agent_create_endpoint(req: AgentCreateRequest):
+    return await agent_create(req.name, req.capabilities, req.model)
 
 @app.get("/v1/agent/list")
 async def agent_list_endpoint():
@@ -157,19 +508,27 @@ async def agent_list_endpoint():
 async def agent_history_endpoint(agent_id: str = Body(None)):
     return await agent_history(agent_id)
 
+@app.get("/v1/agent/history/stream")
+async def agent_history_stream_endpoint(agent_id: str = None):
+    return StreamingResponse(agent_history_stream(agent_id), media_type="application/x-ndjson")
+
 @app.post("/v1/orchestrate/ansible/playbook")
-async def orchestrate_ansible_playbook(playbook_path: str = Body(...), inventory: str = Body(None), 
-                                      extra_vars: dict = Body(None), tags: list = Body(None), limit: str = Body(None)):
-    return await run_ansible_playbook(playbook_path, inventory, extra_vars, tags, limit)
+async def orchestrate_ansible_playbook(req: OrchestrateAnsiblePlaybookRequest):
+    return await run_ansible_playbook(req.playbook_path, req.inventory, req.extra_vars, req.tags, req.limit,
+                                      cacheable=req.cacheable, force=req.force)
+
+@app.post("/v1/orchestrate/ansible/playbooks/batch")
+async def orchestrate_ansible_playbooks_batch(req: OrchestrateAnsiblePlaybookBatchRequest):
+    requests = [playbook.model_dump(exclude_none=True) for playbook in req.playbooks]
+    return await run_ansible_playbooks_batch(requests, req.max_concurrency)
 
 @app.post("/v1/orchestrate/ansible/adhoc")
-async def orchestrate_ansible_adhoc(hosts: str = Body(...), module: str = Body(...), 
-                                   args: str = Body(""), inventory: str = Body(None)):
-    return await run_ansible_adhoc(hosts, module, args, inventory)
+async def orchestrate_ansible_adhoc(req: OrchestrateAnsibleAdhocRequest):
+    return await run_ansible_adhoc(req.hosts, req.module, req.args, req.inventory)
 
 @app.post("/v1/orchestrate/ansible/create_playbook")
-async def orchestrate_ansible_create_playbook(name: str = Body(...), plays: list = Body(...)):
-    return await create_ansible_playbook(name, plays)
+async def orchestrate_ansible_create_playbook(req: OrchestrateAnsibleCreatePlaybookRequest):
+    return await create_ansible_playbook(req.name, req.plays)
 
 @app.get("/v1/orchestrate/ansible/playbooks")
 async def orchestrate_ansible_list_playbooks():
@@ -180,207 +539,263 @@ async def orchestrate_terraform_init(working_dir: str = Body(".")):
     return await terraform_init(working_dir)
 
 @app.post("/v1/orchestrate/terraform/plan")
-async def orchestrate_terraform_plan(working_dir: str = Body("."), var_file: str = Body(None), variables: dict = Body(None)):
-    return await terraform_plan(working_dir, var_file, variables)
+async def orchestrate_terraform_plan(req: OrchestrateTerraformPlanRequest):
+    return await terraform_plan(req.working_dir, req.var_file, req.variables)
 
 @app.post("/v1/orchestrate/terraform/apply")
-async def orchestrate_terraform_apply(working_dir: str = Body("."), auto_approve: bool = Body(False), 
-                                     var_file: str = Body(None), variables: dict = Body(None)):
-    return await terraform_apply(working_dir, auto_approve, var_file, variables)
+async def orchestrate_terraform_apply(req: OrchestrateTerraformApplyRequest):
+    return await terraform_apply(req.working_dir, req.auto_approve, req.var_file, req.variables)
 
 @app.post("/v1/orchestrate/terraform/destroy")
-async def orchestrate_terraform_destroy(working_dir: str = Body("."), auto_approve: bool = Body(False), 
-                                       var_file: str = Body(None), variables: dict = Body(None)):
-    return await terraform_destroy(working_dir, auto_approve, var_file, variables)
+async def orchestrate_terraform_destroy(req: OrchestrateTerraformDestroyRequest):
+    return await terraform_destroy(req.working_dir, req.auto_approve, req.var_file, req.variables)
 
 @app.get("/v1/orchestrate/terraform/state")
 async def orchestrate_terraform_state(working_dir: str = Body(".")):
     return await terraform_show_state(working_dir)
 
 @app.post("/v1/orchestrate/terraform/workspace")
-async def orchestrate_terraform_workspace(name: str = Body(...), template: str = Body(None)):
-    return await create_terraform_workspace(name, template)
+async def orchestrate_terraform_workspace(req: OrchestrateTerraformWorkspaceRequest):
+    return await create_terraform_workspace(req.name, req.template)
 
 @app.post("/v1/orchestrate/proxmox/connect")
-async def orchestrate_proxmox_connect(host: str = Body(...), user: str = Body(...), password: str = Body(...), 
-                                     verify_ssl: bool = Body(False), connection_id: str = Body("default")):
-    return await connect_proxmox(host, user, password, verify_ssl, connection_id)
+async def orchestrate_proxmox_connect(req: OrchestrateProxmoxConnectRequest):
+    return await connect_proxmox(req.host, req.user, req.password, req.verify_ssl, req.connection_id)
 
 @app.get("/v1/orchestrate/proxmox/nodes")
 async def orchestrate_proxmox_nodes(connection_id: str = Body("default")):
     return await proxmox_list_nodes(connection_id)
 
 @app.get("/v1/orchestrate/proxmox/vms")
-async def orchestrate_proxmox_vms(node: str = Body(...), connection_id: str = Body("default")):
-    return await proxmox_list_vms(node, connection_id)
+async def orchestrate_proxmox_vms(req: OrchestrateProxmoxVmsRequest):
+    return await proxmox_list_vms(req.node, req.connection_id)
 
 @app.post("/v1/orchestrate/proxmox/vm/create")
-async def orchestrate_proxmox_create_vm(node: str = Body(...), vmid: int = Body(...), 
-                                       config: dict = Body(...), connection_id: str = Body("default")):
-    return await proxmox_create_vm(node, vmid, config, connection_id)
+async def orchestrate_proxmox_create_vm(req: OrchestrateProxmoxCreateVmRequest):
+    return await proxmox_create_vm(req.node, req.vmid, req.config, req.connection_id)
 
 @app.post("/v1/orchestrate/proxmox/vm/start")
-async def orchestrate_proxmox_start_vm(node: str = Body(...), vmid: int = Body(...), connection_id: str = Body("default")):
-    return await proxmox_start_vm(node, vmid, connection_id)
+async def orchestrate_proxmox_start_vm(req: OrchestrateProxmoxStartVmRequest):
+    return await proxmox_start_vm(req.node, req.vmid, req.connection_id)
 
 @app.post("/v1/orchestrate/proxmox/vm/stop")
-async def orchestrate_proxmox_stop_vm(node: str = Body(...), vmid: int = Body(...), connection_id: str = Body("default")):
-    return await proxmox_stop_vm(node, vmid, connection_id)
+async def orchestrate_proxmox_stop_vm(req: OrchestrateProxmoxStopVmRequest):
+    return await proxmox_stop_vm(req.node, req.vmid, req.connection_id)
 
 @app.get("/v1/orchestrate/proxmox/cluster/status")
 async def orchestrate_proxmox_cluster_status(connection_id: str = Body("default")):
     return await proxmox_get_cluster_status(connection_id)
 
 @app.post("/v1/orchestrate/ssh/connect")
-async def orchestrate_ssh_connect(host: str = Body(...), user: str = Body(...), password: str = Body(None), 
-                                 private_key_path: str = Body(None), port: int = Body(22), connection_id: str = Body("default")):
-    return await ssh_connect(host, user, password, private_key_path, port, connection_id)
+async def orchestrate_ssh_connect(req: OrchestrateSshConnectRequest):
+    return await ssh_connect(req.host, req.user, req.password, req.private_key_path, req.port, req.connection_id)
 
 @app.post("/v1/orchestrate/ssh/execute")
-async def orchestrate_ssh_execute(command: str = Body(...), connection_id: str = Body("default"), timeout: int = Body(30)):
-    return await ssh_execute(command, connection_id, timeout)
+async def orchestrate_ssh_execute(req: OrchestrateSshExecuteRequest):
+    return await ssh_execute(req.command, req.connection_id, req.timeout)
 
 @app.post("/v1/orchestrate/ssh/upload")
-async def orchestrate_ssh_upload(local_path: str = Body(...), remote_path: str = Body(...), connection_id: str = Body("default")):
-    return await ssh_upload_file(local_path, remote_path, connection_id)
+async def orchestrate_ssh_upload(req: OrchestrateSshUploadRequest):
+    return await ssh_upload_file(req.local_path, req.remote_path, req.connection_id)
 
 @app.post("/v1/orchestrate/ssh/script")
-async def orchestrate_ssh_script(script_content: str = Body(...), connection_id: str = Body("default"), interpreter: str = Body("bash")):
-    return await ssh_execute_script(script_content, connection_id, interpreter)
+async def orchestrate_ssh_script(req: OrchestrateSshScriptRequest):
+    return await ssh_execute_script(req.script_content, req.connection_id, req.interpreter)
 
 @app.post("/v1/orchestrate/ssh/generate_keys")
-async def orchestrate_ssh_generate_keys(key_name: str = Body(...), key_type: str = Body("rsa"), key_size: int = Body(2048)):
-    return await ssh_generate_keys(key_name, key_type, key_size)
+async def orchestrate_ssh_generate_keys(req: OrchestrateSshGenerateKeysRequest):
+    return await ssh_generate_keys(req.key_name, req.key_type, req.key_size)
 
 @app.get("/v1/orchestrate/ssh/connections")
 async def orchestrate_ssh_connections():
     return await ssh_list_connections()
 
+# PowerShell commands run synchronously, so they get their own bounded pool
+# instead of blocking the event loop; bash runs as an asyncio subprocess. The
+# semaphores reject with 429 once every slot is busy
+POWERSHELL_POOL_SIZE = 8
+BASH_MAX_CONCURRENCY = 16
+POWERSHELL_POOL = ThreadPoolExecutor(max_workers=POWERSHELL_POOL_SIZE, thread_name_prefix="ps")
+_powershell_slots = asyncio.Semaphore(POWERSHELL_POOL_SIZE)
+_bash_slots = asyncio.Semaphore(BASH_MAX_CONCURRENCY)
+
+async def _run_in_pool(pool: ThreadPoolExecutor, slots: asyncio.Semaphore, func, *args):
+    if slots.locked():
+        raise HTTPException(status_code=429, detail="Too many concurrent commands, retry later")
+    async with slots:
+        return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+
 @app.post("/v1/orchestrate/powershell")
 async def orchestrate_powershell(command: str = Body(...)):
-    return run_powershell_command(command)
+    return await _run_in_pool(POWERSHELL_POOL, _powershell_slots, run_powershell_command, command)
 
 @app.post("/v1/orchestrate/bash")
-async def orchestrate_bash(command: str = Body(...)):
-    return run_bash_command(command)
-
-talos_k8s = TalosK8sOrchestrator()
-monitoring = MonitoringOrchestrator()
-database = DatabaseOrchestrator()
-security = SecurityScannerOrchestrator()
-workflow = WorkflowOrchestrator()
-crypto = CryptoOrchestrator()
-revenue_optimization = RevenueOptimizationOrchestrator()
-financial_analytics = FinancialAnalyticsOrchestrator()
+async def orchestrate_bash(command: Union[str, List[str]] = Body(...)):
+    # run_bash_command is a native asyncio subprocess; only the slot limit applies
+    if _bash_slots.locked():
+        raise HTTPException(status_code=429, detail="Too many concurrent commands, retry later")
+    async with _bash_slots:
+        return await run_bash_command(command)
+
+# Orchestrator MCPs are imported and constructed during startup, off the event
+# loop, rather than at module import. ENABLED_MCPS (comma-separated names)
+# restricts which ones are loaded; unset enables all of them.
+ORCHESTRATORS = {
+    "talos_k8s": ("app.orchestration.talos_k8s_module", "TalosK8sOrchestrator"),
+    "monitoring": ("app.orchestration.monitoring_module", "MonitoringOrchestrator"),
+    "database": ("app.orchestration.database_module", "DatabaseOrchestrator"),
+    "security": ("app.orchestration.security_scanner_module", "SecurityScannerOrchestrator"),
+    "workflow": ("app.orchestration.workflow_module", "WorkflowOrchestrator"),
+    # New crypto and financial MCPs
+    "crypto": ("app.orchestration.mcp_crypto", "CryptoOrchestrator"),
+    "revenue_optimization": ("app.orchestration.mcp_revenue_optimization", "RevenueOptimizationOrchestrator"),
+    "financial_analytics": ("app.orchestration.mcp_financial_analytics", "FinancialAnalyticsOrchestrator"),
+}
+ENABLED_MCPS = frozenset(m for m in os.getenv("ENABLED_MCPS", ",".join(ORCHESTRATORS)).split(",") if m)
+
+def _load_orchestrator(name: str):
+    module_name, class_name = ORCHESTRATORS[name]
+    return getattr(importlib.import_module(module_name), class_name)()
+
+async def _load_orchestrators() -> Dict[str, Any]:
+    names = [name for name in ORCHESTRATORS if name in ENABLED_MCPS]
+    instances = await asyncio.gather(*(asyncio.to_thread(_load_orchestrator, name) for name in names))
+    return dict(zip(names, instances))
+
+def get_orchestrator(request: Request, name: str):
+    """Return the orchestrator instance loaded for name at startup"""
+    orchestrator = request.app.state.orchestrators.get(name)
+    if orchestrator is None:
+        raise HTTPException(status_code=503, detail=f"Orchestrator '{name}' is not enabled.")
+    return orchestrator
 
 # --- Talos/K8s Orchestration Endpoints ---
 @app.post("/v1/orchestrate/talos_k8s/cluster/create")
-async def talos_create_cluster(cluster_config: dict = Body(...)):
-    return await talos_k8s.create_cluster(cluster_config)
+async def talos_create_cluster(request: Request, cluster_config: dict = Body(...)):
+    return await get_orchestrator(request, "talos_k8s").create_cluster(cluster_config)
 
 @app.post("/v1/orchestrate/talos_k8s/cluster/delete")
-async def talos_delete_cluster(cluster_id: str = Body(...)):
-    return await talos_k8s.delete_cluster(cluster_id)
+async def talos_delete_cluster(request: Request, cluster_id: str = Body(...)):
+    return await get_orchestrator(request, "talos_k8s").delete_cluster(cluster_id)
 
 @app.post("/v1/orchestrate/talos_k8s/node/add")
-async def talos_add_node(cluster_id: str = Body(...), node_config: dict = Body(...)):
-    return await talos_k8s.add_node(cluster_id, node_config)
+async def talos_add_node(request: Request, req: TalosAddNodeRequest):
+    return await get_orchestrator(request, "talos_k8s").add_node(req.cluster_id, req.node_config)
 
 @app.post("/v1/orchestrate/talos_k8s/node/remove")
-async def talos_remove_node(cluster_id: str = Body(...), node_id: str = Body(...)):
-    return await talos_k8s.remove_node(cluster_id, node_id)
+async def talos_remove_node(request: Request, req: TalosRemoveNodeRequest):
+    return await get_orchestrator(request, "talos_k8s").remove_node(req.cluster_id, req.node_id)
 
 @app.get("/v1/orchestrate/talos_k8s/cluster/status")
-async def talos_cluster_status(cluster_id: str):
-    return await talos_k8s.get_cluster_status(cluster_id)
+async def talos_cluster_status(request: Request, cluster_id: str):
+    return await get_orchestrator(request, "talos_k8s").get_cluster_status(cluster_id)
 
 # --- Monitoring Orchestration Endpoints ---
 @app.post("/v1/orchestrate/monitoring/deploy")
-async def monitoring_deploy(cluster_id: str = Body(...), config: dict = Body(...)):
-    return await monitoring.deploy_monitoring(cluster_id, config)
+async def monitoring_deploy(request: Request, req: MonitoringDeployRequest):
+    return await get_orchestrator(request, "monitoring").deploy_monitoring(req.cluster_id, req.config)
 
 @app.get("/v1/orchestrate/monitoring/metrics")
-async def monitoring_metrics(cluster_id: str, query: str):
-    return await monitoring.get_metrics(cluster_id, query)
+async def monitoring_metrics(request: Request, cluster_id: str, query: str):
+    return await get_orchestrator(request, "monitoring").get_metrics(cluster_id, query)
 
 @app.get("/v1/orchestrate/monitoring/status")
-async def monitoring_status(cluster_id: str):
-    return await monitoring.get_monitoring_status(cluster_id)
+async def monitoring_status(request: Request, cluster_id: str):
+    return await get_orchestrator(request, "monitoring").get_monitoring_status(cluster_id)
 
 # --- Database Orchestration Endpoints ---
 @app.post("/v1/orchestrate/database/provision")
-async def database_provision(db_config: dict = Body(...)):
-    return await database.provision_database(db_config)
+async def database_provision(request: Request, db_config: dict = Body(...)):
+    return await get_orchestrator(request, "database").provision_database(db_config)
 
 @app.post("/v1/orchestrate/database/delete")
-async def database_delete(db_id: str = Body(...)):
-    return await database.delete_database(db_id)
+async def database_delete(request: Request, db_id: str = Body(...)):
+    return await get_orchestrator(request, "database").delete_database(db_id)
 
 @app.get("/v1/orchestrate/database/status")
-async def database_status(db_id: str):
-    return await database.get_database_status(db_id)
+async def database_status(request: Request, db_id: str):
+    return await get_orchestrator(request, "database").get_database_status(db_id)
 
 # --- Security Scanning Orchestration Endpoints ---
 @app.post("/v1/orchestrate/security/scan")
-async def security_scan(target: str = Body(...), scan_type: str = Body("full")):
-    return await security.run_security_scan(target, scan_type)
+async def security_scan(request: Request, req: SecurityScanRequest):
+    return await get_orchestrator(request, "security").run_security_scan(req.target, req.scan_type)
 
 @app.get("/v1/orchestrate/security/report")
-async def security_report(report_id: str):
-    return await security.get_scan_report(report_id)
+async def security_report(request: Request, report_id: str):
+    return await get_orchestrator(request, "security").get_scan_report(report_id)
 
 # --- Workflow Automation Orchestration Endpoints ---
 @app.post("/v1/orchestrate/workflow/create")
-async def workflow_create(workflow_config: dict = Body(...)):
-    return await workflow.create_workflow(workflow_config)
+async def workflow_create(request: Request, workflow_config: dict = Body(...)):
+    return await get_orchestrator(request, "workflow").create_workflow(workflow_config)
 
 @app.post("/v1/orchestrate/workflow/execute")
-async def workflow_execute(workflow_id: str = Body(...), params: dict = Body(None)):
-    return await workflow.execute_workflow(workflow_id, params)
+async def workflow_execute(request: Request, req: WorkflowExecuteRequest):
+    return await get_orchestrator(request, "workflow").execute_workflow(req.workflow_id, req.params)
 
 @app.get("/v1/orchestrate/workflow/status")
-async def workflow_status(workflow_id: str):
-    return await workflow.get_workflow_status(workflow_id)
+async def workflow_status(request: Request, workflow_id: str):
+    return await get_orchestrator(request, "workflow").get_workflow_status(workflow_id)
 
 # --- Crypto, Revenue, and Financial MCP Endpoints are defined at the end of the file ---
 # (see below for /v1/orchestrate/crypto/*, /v1/orchestrate/revenue/*, /v1/orchestrate/financial/*)
 
 # --- Enhanced Model Discovery ---
+# These payloads never change, so they are serialized once at import time
+_DISCOVER_CRYPTO = orjson.dumps({
+    "blockchain_networks": ["ethereum", "bitcoin", "polygon", "bsc", "arbitrum", "optimism"],
+    "defi_protocols": ["uniswap", "compound", "aave", "curve", "yearn"],
+    "nft_standards": ["erc721", "erc1155", "spl_token"],
+    "oracle_providers": ["chainlink", "band", "api3", "pyth"],
+    "bridge_protocols": ["stargate", "multichain", "hop", "across"]
+})
+_DISCOVER_FINANCIAL = orjson.dumps({
+    "market_data_providers": ["binance", "coinbase", "alpaca", "polygon", "twelvedata"],
+    "technical_indicators": ["trend", "momentum", "volatility", "volume"],
+    "trading_strategies": ["mean_reversion", "trend_following", "breakout", "arbitrage"],
+    "risk_models": ["var", "cvar", "monte_carlo", "black_scholes"],
+    "compliance_frameworks": ["kyc", "aml", "mifid_ii", "dodd_frank", "gdpr"]
+})
+_DISCOVERY_CACHE_HEADERS = {"Cache-Control": "public, max-age=300"}
+
 @app.get("/v1/models/discover/crypto")
 async def discover_crypto_models():
     """Discover available cryptocurrency and DeFi models"""
-    return {
-        "blockchain_networks": ["ethereum", "bitcoin", "polygon", "bsc", "arbitrum", "optimism"],
-        "defi_protocols": ["uniswap", "compound", "aave", "curve", "yearn"],
-        "nft_standards": ["erc721", "erc1155", "spl_token"],
-        "oracle_providers": ["chainlink", "band", "api3", "pyth"],
-        "bridge_protocols": ["stargate", "multichain", "hop", "across"]
-    }
+    return Response(content=_DISCOVER_CRYPTO, media_type="application/json", headers=_DISCOVERY_CACHE_HEADERS)
 
 @app.get("/v1/models/discover/financial")
 async def discover_financial_models():
     """Discover available financial analysis models"""
-    return {
-        "market_data_providers": ["binance", "coinbase", "alpaca", "polygon", "twelvedata"],
-        "technical_indicators": ["trend", "momentum", "volatility", "volume"],
-        "trading_strategies": ["mean_reversion", "trend_following", "breakout", "arbitrage"],
-        "risk_models": ["var", "cvar", "monte_carlo", "black_scholes"],
-        "compliance_frameworks": ["kyc", "aml", "mifid_ii", "dodd_frank", "gdpr"]
-    }
+    return Response(content=_DISCOVER_FINANCIAL, media_type="application/json", headers=_DISCOVERY_CACHE_HEADERS)
 
 # --- Health Check for New MCPs ---
+_CRYPTO_HEALTH = orjson.dumps({"status": "operational", "modules": ["blockchain", "defi", "nft", "portfolio"]})
+_REVENUE_HEALTH = orjson.dumps({"status": "operational", "modules": ["mining", "compute_sharing", "ai_services", "pricing"]})
+_FINANCIAL_HEALTH = orjson.dumps({"status": "operational", "modules": ["market_data", "analytics", "trading", "compliance"]})
+# Short max-age so probes behind a cache still notice the gateway going away
+_HEALTH_CACHE_HEADERS = {"Cache-Control": "public, max-age=10"}
+
 @app.get("/v1/orchestrate/health/crypto")
 async def crypto_health():
-    return {"status": "operational", "modules": ["blockchain", "defi", "nft", "portfolio"]}
+    return Response(content=_CRYPTO_HEALTH, media_type="application/json", headers=_HEALTH_CACHE_HEADERS)
 
 @app.get("/v1/orchestrate/health/revenue")
 async def revenue_health():
-    return {"status": "operational", "modules": ["mining", "compute_sharing", "ai_services", "pricing"]}
+    return Response(content=_REVENUE_HEALTH, media_type="application/json", headers=_HEALTH_CACHE_HEADERS)
 
 @app.get("/v1/orchestrate/health/financial")
 async def financial_health():
-    return {"status": "operational", "modules": ["market_data", "analytics", "trading", "compliance"]}
+    return Response(content=_FINANCIAL_HEALTH, media_type="application/json", headers=_HEALTH_CACHE_HEADERS)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "app.ai_gateway:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("GATEWAY_WORKERS", "4")),
+        log_level="info",
+    )
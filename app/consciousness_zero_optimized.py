@@ -6,43 +6,165 @@ Clean, focused AI agent for local deployment with Open WebUI integration
 
 import os
 import sys
-import json
 import logging
+import logging.handlers
+import queue
+import atexit
 import asyncio
-from typing import Dict, List, Any, Optional, Union
+import re
+import shlex
+import functools
+from typing import Awaitable, Callable, Dict, List, Any, Optional, Union
 from datetime import datetime
+from collections import OrderedDict, defaultdict, deque
+import itertools
 from pathlib import Path
-import subprocess
+import time
 import psutil
 import httpx
-import requests
-
-# Configure logging
+import orjson
+
+try:
+    import docker
+except ImportError:
+    docker = None
+
+# Configure logging; file writes happen on a background listener thread so
+# request handling never blocks on disk I/O
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.FileHandler('/app/logs/consciousness.log'), respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('/app/logs/consciousness.log')
+        logging.handlers.QueueHandler(_log_queue)
     ]
 )
 logger = logging.getLogger(__name__)
 
+def format_ts_ns(ts_ns: int) -> str:
+    """Render a time.time_ns() value as a local ISO-8601 timestamp"""
+    return datetime.fromtimestamp(ts_ns / 1e9).isoformat()
+
+# Interactions remembered per user
+MEMORY_MAX_INTERACTIONS = 100
+# Stored interactions keep only a short prefix of the response; full bodies
+# live in a separate bounded cache keyed by response_id
+RESPONSE_DIGEST_CHARS = 256
+FULL_RESPONSE_CACHE_SIZE = 256
+
+# Intent categories in priority order: (tool, trigger words, parameter name).
+# Common plurals/inflections are listed since matching is per whole word.
+INTENT_KEYWORDS = (
+    ("system_monitor", frozenset({"status", "monitor", "monitoring", "system", "health", "performance"}), "type"),
+    ("shell_executor", frozenset({"run", "execute", "shell", "command", "commands", "bash"}), "command"),
+    ("web_search", frozenset({"search", "find", "lookup", "google", "web"}), "query"),
+    ("file_manager", frozenset({"file", "files", "directory", "folder", "folders", "list", "ls", "cat"}), "operation"),
+    ("network_scanner", frozenset({"network", "scan", "ping", "port", "ports", "nmap"}), "target"),
+    ("log_analyzer", frozenset({"log", "logs", "error", "errors", "debug", "analyze"}), "query"),
+    ("memory_manager", frozenset({"remember", "recall", "memory", "history"}), "operation"),
+)
+# All trigger words compiled into one alternation with a named group per tool,
+# so a message is scanned once regardless of how many categories there are
+_INTENT_RE = re.compile(r"\b(?:%s)\b" % "|".join(
+    f"(?P<{tool}>{'|'.join(sorted(keywords, key=len, reverse=True))})"
+    for tool, keywords, _ in INTENT_KEYWORDS
+))
+_INTENT_PRIORITY = {tool: rank for rank, (tool, _, _) in enumerate(INTENT_KEYWORDS)}
+
+@functools.lru_cache(maxsize=128)
+def _classify_intent(message_lower: str) -> tuple:
+    """Map a lowercased message to (tool, parameter name); rules are static so results never go stale"""
+    best = None
+    for match in _INTENT_RE.finditer(message_lower):
+        rank = _INTENT_PRIORITY[match.lastgroup]
+        if best is None or rank < best:
+            best = rank
+            if rank == 0:
+                break
+    if best is None:
+        # Default to general assistance
+        return "general", "message"
+    tool, _, param = INTENT_KEYWORDS[best]
+    return tool, param
+
+# Keyword hits needed before a memory is tagged with a topic
+TOPIC_MIN_HITS = 1
+
+@functools.lru_cache(maxsize=128)
+def _message_topics(message_lower: str) -> frozenset:
+    """Topic labels for a message, reusing the intent keyword regex"""
+    hits: Dict[str, int] = {}
+    for match in _INTENT_RE.finditer(message_lower):
+        hits[match.lastgroup] = hits.get(match.lastgroup, 0) + 1
+    return frozenset(topic for topic, count in hits.items() if count >= TOPIC_MIN_HITS)
+
 class ConsciousnessAgent:
     """
     Core AI agent for infrastructure orchestration and assistance
     Designed for local deployment with Open WebUI integration
     """
     
+    # Reply for unrecognized intents; only the echoed message varies
+    _DEFAULT_TEMPLATE = """🧠 **Consciousness Control Center**
+
+I understand you said: "{message}"
+
+**Available capabilities:**
+- 📊 **System Monitoring**: Check system status and performance
+- 🖥️ **Shell Execution**: Run system commands safely
+- 🔍 **Web Search**: Search the internet for information
+- 📁 **File Management**: Manage files and directories
+- 🌐 **Network Scanning**: Scan networks and check connectivity
+- 📝 **Log Analysis**: Analyze system logs and errors
+- 🧠 **Memory**: Remember and recall information
+
+**Example commands:**
+- "What's the system status?"
+- "Run 'docker ps' command"
+- "Search for Docker best practices"
+- "List files in /app/data"
+- "Scan network for devices"
+- "Analyze error logs"
+- "Remember this configuration"
+
+How can I help you today?
+"""
+    
     def __init__(self, config_path: str = "/app/config/config.json"):
         self.config = self._load_config(config_path)
-        self.tools = self._initialize_tools()
-        self.memory = {}
+        # One pooled client shared by every tool that does HTTP I/O
+        self.http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=10.0
+        )
+        # First cpu_percent(interval=None) call only sets the baseline; do it now
+        # since SystemMonitor itself is only built on the first status query
+        psutil.cpu_percent(interval=None)
+        self._tool_factories = self._initialize_tools()
+        self.tools: Dict[str, Any] = {}
+        # Bound tool.execute methods, so dispatch is one dict lookup per message
+        self._dispatch: Dict[str, Callable[[Dict[str, Any], str], Awaitable[str]]] = {}
+        # Per-user ring buffer of recent interactions; the oldest fall off automatically
+        self.memory: Dict[str, deque] = defaultdict(lambda: deque(maxlen=MEMORY_MAX_INTERACTIONS))
+        # Same entries indexed per user and topic, so recall can skip unrelated history
+        self.memory_by_topic: Dict[str, Dict[str, deque]] = defaultdict(
+            lambda: defaultdict(lambda: deque(maxlen=MEMORY_MAX_INTERACTIONS))
+        )
+        # Full response bodies by id, least recently stored evicted first
+        self.full_responses: "OrderedDict[int, Any]" = OrderedDict()
+        self._response_ids = itertools.count()
         self.context_cache = {}
         
         logger.info(f"🧠 Consciousness Control Center initialized")
         logger.info(f"📊 Environment: Docker Container")
-        logger.info(f"🛠️ Tools loaded: {len(self.tools)}")
+        logger.info(f"🛠️ Tools enabled: {len(self._tool_factories)}")
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from file or environment variables"""
@@ -66,8 +188,8 @@ class ConsciousnessAgent:
         
         try:
             if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    file_config = json.load(f)
+                with open(config_path, 'rb') as f:
+                    file_config = orjson.loads(f.read())
                 default_config.update(file_config)
             
             # Override with environment variables
@@ -82,32 +204,26 @@ class ConsciousnessAgent:
             logger.warning(f"Config load error: {e}. Using defaults.")
             return default_config
     
-    def _initialize_tools(self) -> Dict[str, Any]:
-        """Initialize available tools based on configuration"""
-        tools = {}
-        
-        if "system_monitor" in self.config["tools_enabled"]:
-            tools["system_monitor"] = SystemMonitor()
-        
-        if "shell_executor" in self.config["tools_enabled"]:
-            tools["shell_executor"] = ShellExecutor()
-        
-        if "web_search" in self.config["tools_enabled"]:
-            tools["web_search"] = WebSearchTool()
-        
-        if "memory_manager" in self.config["tools_enabled"]:
-            tools["memory_manager"] = MemoryManager()
-        
-        if "file_manager" in self.config["tools_enabled"]:
-            tools["file_manager"] = FileManager()
-        
-        if "network_scanner" in self.config["tools_enabled"]:
-            tools["network_scanner"] = NetworkScanner()
-        
-        if "log_analyzer" in self.config["tools_enabled"]:
-            tools["log_analyzer"] = LogAnalyzer()
-        
-        return tools
+    def _initialize_tools(self) -> Dict[str, Callable[[], Any]]:
+        """Map enabled tool names to factories; tools are built on first use"""
+        factories = {
+            "system_monitor": SystemMonitor,
+            "shell_executor": ShellExecutor,
+            "web_search": functools.partial(WebSearchTool, self.http),
+            "memory_manager": functools.partial(MemoryManager, self),
+            "file_manager": FileManager,
+            "network_scanner": NetworkScanner,
+            "log_analyzer": LogAnalyzer,
+        }
+        return {name: factory for name, factory in factories.items() if name in self.config["tools_enabled"]}
+    
+    def _get_dispatch(self, tool_name: str) -> Callable[[Dict[str, Any], str], Awaitable[str]]:
+        """Return the tool's bound execute, building the tool on first use"""
+        execute = self._dispatch.get(tool_name)
+        if execute is None:
+            tool = self.tools[tool_name] = self._tool_factories[tool_name]()
+            execute = self._dispatch[tool_name] = tool.execute
+        return execute
     
     async def process_message(self, message: str, user_id: str = "local") -> Dict[str, Any]:
         """
@@ -121,18 +237,20 @@ class ConsciousnessAgent:
             intent = self._analyze_intent(message)
             
             # Route to appropriate tool
-            if intent["tool"] in self.tools:
-                result = await self._execute_tool(intent["tool"], intent["parameters"], message)
+            if intent["tool"] in self._tool_factories:
+                parameters = {**intent["parameters"], "user_id": user_id}
+                result = await self._execute_tool(intent["tool"], parameters, message)
             else:
                 result = await self._default_response(message)
             
-            # Store in memory
-            self._store_interaction(user_id, message, result)
+            # Store in memory; one clock read serves both the entry and the reply
+            ts_ns = time.time_ns()
+            self._store_interaction(user_id, message, result, intent, ts_ns)
             
             return {
                 "response": result,
                 "intent": intent,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": format_ts_ns(ts_ns),
                 "agent": self.config["agent_name"]
             }
             
@@ -146,50 +264,15 @@ class ConsciousnessAgent:
     
     def _analyze_intent(self, message: str) -> Dict[str, Any]:
         """Analyze message to determine intent and parameters"""
-        message_lower = message.lower()
-        
-        # System monitoring
-        if any(word in message_lower for word in ["status", "monitor", "system", "health", "performance"]):
-            return {"tool": "system_monitor", "parameters": {"type": "status"}}
-        
-        # Shell commands
-        elif any(word in message_lower for word in ["run", "execute", "shell", "command", "bash"]):
-            return {"tool": "shell_executor", "parameters": {"command": message}}
-        
-        # Web search
-        elif any(word in message_lower for word in ["search", "find", "lookup", "google", "web"]):
-            return {"tool": "web_search", "parameters": {"query": message}}
-        
-        # File operations
-        elif any(word in message_lower for word in ["file", "directory", "folder", "list", "ls", "cat"]):
-            return {"tool": "file_manager", "parameters": {"operation": message}}
-        
-        # Network operations
-        elif any(word in message_lower for word in ["network", "scan", "ping", "port", "nmap"]):
-            return {"tool": "network_scanner", "parameters": {"target": message}}
-        
-        # Log analysis
-        elif any(word in message_lower for word in ["log", "error", "debug", "analyze"]):
-            return {"tool": "log_analyzer", "parameters": {"query": message}}
-        
-        # Memory operations
-        elif any(word in message_lower for word in ["remember", "recall", "memory", "history"]):
-            return {"tool": "memory_manager", "parameters": {"operation": message}}
-        
-        # Default to general assistance
-        else:
-            return {"tool": "general", "parameters": {"message": message}}
+        tool, param = _classify_intent(message.lower())
+        if tool == "system_monitor":
+            return {"tool": tool, "parameters": {"type": "status"}}
+        return {"tool": tool, "parameters": {param: message}}
     
     async def _execute_tool(self, tool_name: str, parameters: Dict[str, Any], original_message: str) -> str:
         """Execute the specified tool with parameters"""
         try:
-            tool = self.tools[tool_name]
-            if hasattr(tool, 'execute'):
-                result = await tool.execute(parameters, original_message)
-            else:
-                result = f"Tool {tool_name} is not properly configured"
-            
-            return result
+            return await self._get_dispatch(tool_name)(parameters, original_message)
             
         except Exception as e:
             logger.error(f"Tool execution error ({tool_name}): {e}")
@@ -197,66 +280,93 @@ class ConsciousnessAgent:
     
     async def _default_response(self, message: str) -> str:
         """Default response for unrecognized intents"""
-        return f"""🧠 **Consciousness Control Center**
-
-I understand you said: "{message}"
-
-**Available capabilities:**
-- 📊 **System Monitoring**: Check system status and performance
-- 🖥️ **Shell Execution**: Run system commands safely
-- 🔍 **Web Search**: Search the internet for information
-- 📁 **File Management**: Manage files and directories
-- 🌐 **Network Scanning**: Scan networks and check connectivity
-- 📝 **Log Analysis**: Analyze system logs and errors
-- 🧠 **Memory**: Remember and recall information
-
-**Example commands:**
-- "What's the system status?"
-- "Run 'docker ps' command"
-- "Search for Docker best practices"
-- "List files in /app/data"
-- "Scan network for devices"
-- "Analyze error logs"
-- "Remember this configuration"
-
-How can I help you today?
-"""
+        return self._DEFAULT_TEMPLATE.format(message=message)
     
-    def _store_interaction(self, user_id: str, message: str, response: Any):
+    async def aclose(self):
+        """Release pooled HTTP connections"""
+        await self.http.aclose()
+    
+    def _store_interaction(self, user_id: str, message: str, response: Any, intent: Dict[str, Any], ts_ns: int):
         """Store interaction in memory for context"""
-        if user_id not in self.memory:
-            self.memory[user_id] = []
+        response_id = next(self._response_ids)
+        self.full_responses[response_id] = response
+        if len(self.full_responses) > FULL_RESPONSE_CACHE_SIZE:
+            self.full_responses.popitem(last=False)
         
-        self.memory[user_id].append({
-            "timestamp": datetime.now().isoformat(),
+        # Raw epoch nanoseconds; format_ts_ns renders them only when needed
+        entry = {
+            "ts_ns": ts_ns,
             "message": message,
-            "response": str(response),
-            "intent": self._analyze_intent(message)
-        })
-        
-        # Limit memory size
-        if len(self.memory[user_id]) > 100:
-            self.memory[user_id] = self.memory[user_id][-50:]
+            "response_digest": response[:RESPONSE_DIGEST_CHARS] if isinstance(response, str) else None,
+            "response_id": response_id,
+            "intent": intent,
+            "topics": _message_topics(message.lower())
+        }
+        self.memory[user_id].append(entry)
+        for topic in entry["topics"]:
+            self.memory_by_topic[user_id][topic].append(entry)
+
+# psutil snapshot shared by every status query within METRICS_TTL seconds
+METRICS_TTL = 1.0
+_METRICS_CACHE = {"ts": 0.0, "val": None}
+_METRICS_LOCK = asyncio.Lock()
+
+async def _metrics_snapshot() -> tuple:
+    """Return (cpu_percent, virtual_memory, disk_usage), sampling at most once per TTL"""
+    if _METRICS_CACHE["val"] is not None and time.monotonic() - _METRICS_CACHE["ts"] < METRICS_TTL:
+        return _METRICS_CACHE["val"]
+    async with _METRICS_LOCK:
+        # Another caller may have refreshed it while we waited
+        if _METRICS_CACHE["val"] is None or time.monotonic() - _METRICS_CACHE["ts"] >= METRICS_TTL:
+            # Non-blocking: CPU usage since the previous call (primed in ConsciousnessAgent)
+            _METRICS_CACHE["val"] = (psutil.cpu_percent(interval=None), psutil.virtual_memory(), psutil.disk_usage('/'))
+            _METRICS_CACHE["ts"] = time.monotonic()
+        return _METRICS_CACHE["val"]
 
 class SystemMonitor:
     """System monitoring and health checks"""
     
+    # Container listings are reused for this long to absorb bursts of status queries
+    DOCKER_CACHE_TTL = 2.0
+    
+    def __init__(self):
+        self._docker = None
+        self._containers = None
+        self._containers_at = 0.0
+    
+    def _list_containers(self) -> str:
+        """Names and statuses of running containers over the Docker socket"""
+        if self._docker is None:
+            self._docker = docker.from_env()
+        # sparse=True uses the single list call instead of inspecting each container
+        rows = [
+            f"{c.attrs['Names'][0].lstrip('/')}\t{c.attrs['Status']}"
+            for c in self._docker.containers.list(sparse=True)
+        ]
+        return "NAMES\tSTATUS\n" + "\n".join(rows)
+    
+    async def _docker_summary(self) -> Optional[str]:
+        if docker is None:
+            return None
+        now = time.monotonic()
+        if self._containers is None or now - self._containers_at > self.DOCKER_CACHE_TTL:
+            self._containers = await asyncio.to_thread(self._list_containers)
+            self._containers_at = now
+        return self._containers
+    
     async def execute(self, parameters: Dict[str, Any], original_message: str) -> str:
         """Execute system monitoring"""
         try:
             # Get system metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            cpu_percent, memory, disk = await _metrics_snapshot()
             
             # Get Docker container info if available
             docker_info = ""
             try:
-                result = subprocess.run(['docker', 'ps', '--format', 'table {{.Names}}\t{{.Status}}'], 
-                                     capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    docker_info = f"\n**Docker Containers:**\n```\n{result.stdout}\n```"
-            except:
+                containers = await self._docker_summary()
+                if containers is not None:
+                    docker_info = f"\n**Docker Containers:**\n```\n{containers}\n```"
+            except Exception:
                 pass
             
             return f"""📊 **System Status Report**
@@ -275,13 +385,19 @@ class SystemMonitor:
         except Exception as e:
             return f"System monitoring error: {str(e)}"
 
+# Leading trigger words stripped from tool input, e.g. "run command ls" -> "ls"
+_SHELL_PREFIX_RE = re.compile(r"^(?:(?:run|execute|shell|command|bash)(?:\s+|$))+", re.I)
+_SEARCH_PREFIX_RE = re.compile(r"^(?:(?:search|find|lookup|google|web)(?:\s+|$))+", re.I)
+
 class ShellExecutor:
     """Safe shell command execution"""
     
-    ALLOWED_COMMANDS = [
+    ALLOWED_COMMANDS = frozenset({
         'ls', 'pwd', 'whoami', 'date', 'uptime', 'df', 'free', 'ps',
         'docker', 'kubectl', 'git', 'curl', 'ping', 'nslookup', 'dig'
-    ]
+    })
+    # Joined once for the rejection message
+    _ALLOWED_STR = ", ".join(sorted(ALLOWED_COMMANDS))
     
     async def execute(self, parameters: Dict[str, Any], original_message: str) -> str:
         """Execute shell command safely"""
@@ -290,15 +406,16 @@ class ShellExecutor:
             command = parameters.get("command", "").strip()
             
             # Remove command prefixes
-            for prefix in ["run", "execute", "shell", "command", "bash"]:
-                if command.lower().startswith(prefix):
-                    command = command[len(prefix):].strip()
+            command = _SHELL_PREFIX_RE.sub("", command, count=1)
             
             if not command:
                 return "Please specify a command to execute."
             
-            # Parse command
-            cmd_parts = command.split()
+            # Parse command, honouring shell quoting
+            try:
+                cmd_parts = shlex.split(command)
+            except ValueError:
+                return "Invalid command format."
             if not cmd_parts:
                 return "Invalid command format."
             
@@ -306,23 +423,28 @@ class ShellExecutor:
             
             # Security check
             if base_command not in self.ALLOWED_COMMANDS:
-                return f"Command '{base_command}' is not allowed for security reasons.\n\nAllowed commands: {', '.join(self.ALLOWED_COMMANDS)}"
-            
-            # Execute command
-            result = subprocess.run(
-                cmd_parts,
-                capture_output=True,
-                text=True,
-                timeout=30,
+                return f"Command '{base_command}' is not allowed for security reasons.\n\nAllowed commands: {self._ALLOWED_STR}"
+            
+            # Execute command without blocking the event loop
+            proc = await asyncio.create_subprocess_exec(
+                *cmd_parts,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 cwd="/app"
             )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return "Command execution timed out (30s limit)."
             
-            output = result.stdout if result.stdout else result.stderr
+            output = (stdout or stderr).decode(errors="replace")
             
             return f"""🖥️ **Command Execution**
 
 **Command**: `{command}`
-**Exit Code**: {result.returncode}
+**Exit Code**: {proc.returncode}
 
 **Output**:
 ```
@@ -330,28 +452,39 @@ class ShellExecutor:
 ```
 """
             
-        except subprocess.TimeoutExpired:
-            return "Command execution timed out (30s limit)."
         except Exception as e:
             return f"Command execution error: {str(e)}"
 
 class WebSearchTool:
     """Web search capabilities"""
     
+    def __init__(self, http: httpx.AsyncClient):
+        self.http = http
+        # SearXNG-compatible JSON search endpoint; searches are simulated when unset
+        self.search_url = os.getenv("CONSCIOUSNESS_SEARCH_URL")
+    
     async def execute(self, parameters: Dict[str, Any], original_message: str) -> str:
         """Perform web search"""
         try:
             query = parameters.get("query", "").strip()
             
             # Extract search query from message
-            for prefix in ["search", "find", "lookup", "google", "web"]:
-                if query.lower().startswith(prefix):
-                    query = query[len(prefix):].strip()
+            query = _SEARCH_PREFIX_RE.sub("", query, count=1)
             
             if not query:
                 return "Please specify what you'd like to search for."
             
-            # Simulate web search (in real implementation, use actual search API)
+            if self.search_url:
+                response = await self.http.get(self.search_url, params={"q": query, "format": "json"})
+                response.raise_for_status()
+                results = orjson.loads(response.content).get("results", [])[:5]
+                lines = "\n".join(f"- [{r.get('title', r.get('url'))}]({r.get('url')})" for r in results)
+                return f"""🔍 **Web Search Results** for: "{query}"
+
+{lines or "No results found."}
+"""
+            
+            # Simulate web search when no search API is configured
             return f"""🔍 **Web Search Results** for: "{query}"
 
 *Note: Web search is currently simulated. In a full implementation, this would connect to search APIs.*
@@ -381,24 +514,29 @@ class FileManager:
             
             # Simple file operations
             if "list" in operation or "ls" in operation:
-                result = subprocess.run(['ls', '-la', '/app'], capture_output=True, text=True)
-                return f"📁 **Directory Listing** (/app):\n```\n{result.stdout}\n```"
+                proc = await asyncio.create_subprocess_exec(
+                    'ls', '-la', '/app', stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                )
+                stdout, _ = await proc.communicate()
+                return f"📁 **Directory Listing** (/app):\n```\n{stdout.decode(errors='replace')}\n```"
             
             elif "config" in operation:
-                if os.path.exists('/app/config/config.json'):
-                    with open('/app/config/config.json', 'r') as f:
-                        config = f.read()
-                    return f"⚙️ **Configuration**:\n```json\n{config}\n```"
-                else:
+                try:
+                    with open('/app/config/config.json', 'rb') as f:
+                        config = f.read().decode('utf-8', errors='replace')
+                except FileNotFoundError:
                     return "Configuration file not found."
+                return f"⚙️ **Configuration**:\n```json\n{config}\n```"
             
             elif "logs" in operation:
-                if os.path.exists('/app/logs/consciousness.log'):
-                    with open('/app/logs/consciousness.log', 'r') as f:
-                        logs = f.read()[-1000:]  # Last 1000 characters
-                    return f"📝 **Recent Logs**:\n```\n{logs}\n```"
-                else:
+                try:
+                    # Read only the tail instead of loading the whole log
+                    with open('/app/logs/consciousness.log', 'rb') as f:
+                        f.seek(max(0, f.seek(0, os.SEEK_END) - 1024))
+                        logs = f.read().decode('utf-8', errors='replace')
+                except FileNotFoundError:
                     return "Log file not found."
+                return f"📝 **Recent Logs**:\n```\n{logs}\n```"
             
             else:
                 return "Available file operations: list, config, logs"
@@ -428,38 +566,136 @@ class NetworkScanner:
         except Exception as e:
             return f"Network operation error: {str(e)}"
 
+@functools.lru_cache(maxsize=None)
+def _log_kernels():
+    """Import the numpy log kernels on first use; None when they can't be loaded"""
+    try:
+        # A sibling module both as app.consciousness_zero_optimized and in the
+        # flat /app layout of the Docker image
+        if __package__:
+            from . import log_kernels
+        else:
+            import log_kernels
+    except ImportError as e:
+        logger.warning(f"Log analysis kernels unavailable, running as plain Python: {e}")
+        return None
+    return log_kernels
+
 class LogAnalyzer:
     """Log analysis and error detection"""
     
+    LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+    LOG_PATH = "/app/logs/consciousness.log"
+    # Only the tail of the log is analyzed so large files stay cheap
+    MAX_BYTES = 4 * 1024 * 1024
+    # Matches the logging.basicConfig format used by this module
+    LINE_RE = re.compile(
+        r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),(\d{3}) - \S+ - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - (.*)$"
+    )
+    BUCKET_SECONDS = 60.0
+    ZSCORE_WINDOW = 10
+    ANOMALY_ZSCORE = 3.0
+    
     async def execute(self, parameters: Dict[str, Any], original_message: str) -> str:
         """Analyze logs for errors and patterns"""
         try:
-            return """📊 **Log Analysis**
+            return await asyncio.to_thread(self._analyze, self.LOG_PATH)
+            
+        except FileNotFoundError:
+            return "Log file not found."
+        except Exception as e:
+            return f"Log analysis error: {str(e)}"
+    
+    def _analyze(self, path: str) -> str:
+        with open(path, 'rb') as f:
+            f.seek(max(0, f.seek(0, os.SEEK_END) - self.MAX_BYTES))
+            text = f.read().decode('utf-8', errors='replace')
+        
+        timestamps, levels, errors = [], [], {}
+        for line in text.splitlines():
+            match = self.LINE_RE.match(line)
+            if not match:
+                continue
+            stamp, millis, level, message = match.groups()
+            timestamps.append(datetime.fromisoformat(stamp).timestamp() + int(millis) / 1000)
+            levels.append(level)
+            if level in ("ERROR", "CRITICAL"):
+                errors[message] = errors.get(message, 0) + 1
+        
+        if not timestamps:
+            return "📊 **Log Analysis**\n\nNo parseable log entries found."
+        
+        kernels = _log_kernels()
+        if kernels is not None:
+            import numpy as np
+            counts = kernels.severity_histogram(np.array([kernels.LEVEL_CODES[level] for level in levels], dtype=np.int8))
+            rate = kernels.events_per_bucket(np.array(timestamps, dtype=np.float64), self.BUCKET_SECONDS)
+            spikes = int((kernels.rolling_zscore(rate, self.ZSCORE_WINDOW) > self.ANOMALY_ZSCORE).sum())
+        else:
+            counts = [levels.count(name) for name in self.LEVELS]
+            rate = self._events_per_bucket(timestamps)
+            spikes = self._count_spikes(rate)
+        
+        severity = "\n".join(f"- **{name}**: {int(count)}" for name, count in zip(self.LEVELS, counts))
+        top_errors = sorted(errors.items(), key=lambda item: item[1], reverse=True)[:5]
+        error_lines = "\n".join(f"- ({count}x) {message[:200]}" for message, count in top_errors) or "- None"
+        
+        return f"""📊 **Log Analysis** ({len(timestamps)} entries)
 
-*Log analysis capabilities are ready for implementation.*
+**Severity:**
+{severity}
 
-**Features:**
-- Error pattern detection
-- Performance metric extraction
-- Anomaly identification
-- Trend analysis
+**Top errors:**
+{error_lines}
 
-**Data sources:**
-- Application logs
-- System logs
-- Container logs
-- Custom log files
+**Activity**: {len(timestamps) / len(rate):.1f} entries/min on average, {spikes} anomalous minute(s) (z > {self.ANOMALY_ZSCORE:g})
 """
-            
-        except Exception as e:
-            return f"Log analysis error: {str(e)}"
+    
+    def _events_per_bucket(self, timestamps: List[float]) -> List[int]:
+        """Plain-Python events_per_bucket for when numpy is unavailable"""
+        start = min(timestamps)
+        counts = [0] * (int((max(timestamps) - start) // self.BUCKET_SECONDS) + 1)
+        for stamp in timestamps:
+            counts[int((stamp - start) // self.BUCKET_SECONDS)] += 1
+        return counts
+    
+    def _count_spikes(self, rate: List[int]) -> int:
+        """Plain-Python rolling z-score spike count for when numpy is unavailable"""
+        spikes = 0
+        window = self.ZSCORE_WINDOW
+        for i in range(window, len(rate)):
+            preceding = rate[i - window:i]
+            mean = sum(preceding) / window
+            var = sum(value * value for value in preceding) / window - mean * mean
+            if var > 1e-12 and (rate[i] - mean) / var ** 0.5 > self.ANOMALY_ZSCORE:
+                spikes += 1
+        return spikes
 
 class MemoryManager:
     """Memory and context management"""
     
+    RECALL_LIMIT = 5
+    
+    def __init__(self, agent: "ConsciousnessAgent"):
+        self.agent = agent
+    
+    def _recall(self, user_id: str, query: str) -> List[Dict[str, Any]]:
+        """Most recent interactions sharing a topic with the query, else the most recent overall"""
+        topics = _message_topics(query.lower()) - {"memory_manager"}
+        if topics:
+            by_topic = self.agent.memory_by_topic[user_id]
+            entries = {id(e): e for topic in topics for e in by_topic.get(topic, ())}.values()
+            return sorted(entries, key=lambda e: e["ts_ns"])[-self.RECALL_LIMIT:]
+        return list(self.agent.memory[user_id])[-self.RECALL_LIMIT:]
+    
     async def execute(self, parameters: Dict[str, Any], original_message: str) -> str:
         """Manage memory and context"""
         try:
+            recalled = self._recall(parameters.get("user_id", "local"), parameters.get("operation", ""))
+            if recalled:
+                lines = "\n".join(f"- {format_ts_ns(e['ts_ns'])}: {e['message'][:120]}" for e in recalled)
+                return f"🧠 **Memory Manager**\n\n**Recalled interactions:**\n{lines}\n"
+            
             return """🧠 **Memory Manager**
 
 *Memory management system is active.*
@@ -523,9 +759,15 @@ if __name__ == "__main__":
             except Exception as e:
                 print(f"Error: {e}")
     
+    async def run_test_interface():
+        try:
+            await test_interface()
+        finally:
+            await agent.aclose()
+    
     # Run test interface
     try:
-        asyncio.run(test_interface())
+        asyncio.run(run_test_interface())
     except KeyboardInterrupt:
         pass
     
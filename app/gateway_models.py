@@ -0,0 +1,154 @@
+"""
+Request body models for the gateway endpoints.
+One model per endpoint that takes several JSON body fields, so FastAPI
+validates the whole body in a single pass.
+"""
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class RagRetrieveRequest(BaseModel):
+    query: str
+    top_k: int = 5
+
+class RagQaRequest(BaseModel):
+    document: str
+    question: str
+    context: Optional[str] = None
+
+class RagCrawlRequest(BaseModel):
+    url: str
+    depth: int = 2
+
+class RagAddDocumentRequest(BaseModel):
+    content: str
+    metadata: dict = {}
+
+class AgentActRequest(BaseModel):
+    task: str
+    context: dict = {}
+    agent_id: Optional[str] = None
+
+class AgentCreateRequest(BaseModel):
+    name: str
+    capabilities: list
+    model: str = "gpt-4"
+
+class OrchestrateAnsiblePlaybookRequest(BaseModel):
+    playbook_path: str
+    inventory: Optional[str] = None
+    extra_vars: Optional[dict] = None
+    tags: Optional[list] = None
+    limit: Optional[str] = None
+    cacheable: bool = False
+    force: bool = False
+
+class OrchestrateAnsiblePlaybookBatchRequest(BaseModel):
+    playbooks: List[OrchestrateAnsiblePlaybookRequest]
+    max_concurrency: int = Field(10, ge=1)
+
+class OrchestrateAnsibleAdhocRequest(BaseModel):
+    hosts: str
+    module: str
+    args: str = ""
+    inventory: Optional[str] = None
+
+class OrchestrateAnsibleCreatePlaybookRequest(BaseModel):
+    name: str
+    plays: list
+
+class OrchestrateTerraformPlanRequest(BaseModel):
+    working_dir: str = "."
+    var_file: Optional[str] = None
+    variables: Optional[dict] = None
+
+class OrchestrateTerraformApplyRequest(BaseModel):
+    working_dir: str = "."
+    auto_approve: bool = False
+    var_file: Optional[str] = None
+    variables: Optional[dict] = None
+
+class OrchestrateTerraformDestroyRequest(BaseModel):
+    working_dir: str = "."
+    auto_approve: bool = False
+    var_file: Optional[str] = None
+    variables: Optional[dict] = None
+
+class OrchestrateTerraformWorkspaceRequest(BaseModel):
+    name: str
+    template: Optional[str] = None
+
+class OrchestrateProxmoxConnectRequest(BaseModel):
+    host: str
+    user: str
+    password: str
+    verify_ssl: bool = False
+    connection_id: str = "default"
+
+class OrchestrateProxmoxVmsRequest(BaseModel):
+    node: str
+    connection_id: str = "default"
+
+class OrchestrateProxmoxCreateVmRequest(BaseModel):
+    node: str
+    vmid: int
+    config: dict
+    connection_id: str = "default"
+
+class OrchestrateProxmoxStartVmRequest(BaseModel):
+    node: str
+    vmid: int
+    connection_id: str = "default"
+
+class OrchestrateProxmoxStopVmRequest(BaseModel):
+    node: str
+    vmid: int
+    connection_id: str = "default"
+
+class OrchestrateSshConnectRequest(BaseModel):
+    host: str
+    user: str
+    password: Optional[str] = None
+    private_key_path: Optional[str] = None
+    port: int = 22
+    connection_id: str = "default"
+
+class OrchestrateSshExecuteRequest(BaseModel):
+    command: str
+    connection_id: str = "default"
+    timeout: int = 30
+
+class OrchestrateSshUploadRequest(BaseModel):
+    local_path: str
+    remote_path: str
+    connection_id: str = "default"
+
+class OrchestrateSshScriptRequest(BaseModel):
+    script_content: str
+    connection_id: str = "default"
+    interpreter: str = "bash"
+
+class OrchestrateSshGenerateKeysRequest(BaseModel):
+    key_name: str
+    key_type: str = "rsa"
+    key_size: int = 2048
+
+class TalosAddNodeRequest(BaseModel):
+    cluster_id: str
+    node_config: dict
+
+class TalosRemoveNodeRequest(BaseModel):
+    cluster_id: str
+    node_id: str
+
+class MonitoringDeployRequest(BaseModel):
+    cluster_id: str
+    config: dict
+
+class SecurityScanRequest(BaseModel):
+    target: str
+    scan_type: str = "full"
+
+class WorkflowExecuteRequest(BaseModel):
+    workflow_id: str
+    params: Optional[dict] = None
@@ -0,0 +1,63 @@
+"""
+Log Analysis Kernels - numeric hot paths for LogAnalyzer
+JIT-compiled with Numba when it is installed, plain Python otherwise
+"""
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:
+    logger.warning("numba not installed; log analysis kernels run as plain Python")
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Severity codes used in the int8 level arrays, in ascending order
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+LEVEL_CODES = {name: code for code, name in enumerate(LEVELS)}
+
+@njit(cache=True)
+def severity_histogram(levels: np.ndarray) -> np.ndarray:
+    """Count log lines per severity code"""
+    counts = np.zeros(5, dtype=np.int64)
+    for i in range(levels.shape[0]):
+        counts[levels[i]] += 1
+    return counts
+
+@njit(cache=True)
+def events_per_bucket(timestamps: np.ndarray, bucket_seconds: float) -> np.ndarray:
+    """Bucket epoch timestamps into fixed-width counts from the earliest one"""
+    n = timestamps.shape[0]
+    if n == 0:
+        return np.zeros(0, dtype=np.float64)
+    start = timestamps.min()
+    buckets = int((timestamps.max() - start) // bucket_seconds) + 1
+    counts = np.zeros(buckets, dtype=np.float64)
+    for i in range(n):
+        counts[int((timestamps[i] - start) // bucket_seconds)] += 1.0
+    return counts
+
+@njit(cache=True)
+def rolling_zscore(values: np.ndarray, window: int) -> np.ndarray:
+    """Z-score of each value against the preceding window (0 until the window fills)"""
+    n = values.shape[0]
+    scores = np.zeros(n, dtype=np.float64)
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        if i >= window:
+            mean = total / window
+            var = total_sq / window - mean * mean
+            if var > 1e-12:
+                scores[i] = (values[i] - mean) / np.sqrt(var)
+            old = values[i - window]
+            total -= old
+            total_sq -= old * old
+        total += values[i]
+        total_sq += values[i] * values[i]
+    return scores
@@ -6,7 +6,7 @@ This module provides integration between Consciousness Control Center and Open W
 import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from datetime import datetime
 
 # Import our consciousness agent
@@ -28,8 +28,9 @@ class ConsciousnessOpenWebUIFunction:
         self.description = "Access to Consciousness Control Center for system management and AI assistance"
     
     async def __call__(self, 
-                      message: str,
+                      message: Optional[str] = None,
                       user_id: str = "openwebui_user",
+                      messages: Optional[List[str]] = None,
                       **kwargs) -> Dict[str, Any]:
         """
         Main function called by Open WebUI
@@ -37,27 +38,24 @@ class ConsciousnessOpenWebUIFunction:
         Args:
             message: User message/query
             user_id: User identifier from Open WebUI
+            messages: Several messages to process concurrently instead of one
             **kwargs: Additional parameters from Open WebUI
             
         Returns:
             Dictionary with response and metadata
         """
+        if messages:
+            return {
+                "success": True,
+                "results": [result async for result in self.batch(messages, user_id)]
+            }
+        
         try:
             logger.info(f"Consciousness function called by {user_id}: {message[:100]}...")
             
             # Process message through consciousness agent
             result = await self.agent.process_message(message, user_id)
-            
-            return {
-                "success": True,
-                "response": result["response"],
-                "metadata": {
-                    "agent": result.get("agent", "Consciousness Zero"),
-                    "timestamp": result.get("timestamp"),
-                    "intent": result.get("intent", {}),
-                    "tools_used": result.get("tools_used", [])
-                }
-            }
+            return self._format_result(result)
             
         except Exception as e:
             logger.error(f"Consciousness function error: {e}")
@@ -66,6 +64,41 @@ class ConsciousnessOpenWebUIFunction:
                 "error": str(e),
                 "response": f"I encountered an error: {str(e)}"
             }
+    
+    async def batch(self, messages: List[str], user_id: str = "openwebui_user") -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process several messages concurrently, yielding each result as soon as
+        it is ready (completion order, not submission order). Each result
+        carries the index of the message it answers.
+        """
+        logger.info(f"Consciousness batch of {len(messages)} messages from {user_id}")
+        
+        async def run(index: int, message: str) -> Dict[str, Any]:
+            result = self._format_result(await self.agent.process_message(message, user_id))
+            result["index"] = index
+            return result
+        
+        tasks = [asyncio.create_task(run(i, m)) for i, m in enumerate(messages)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Caller stopped early or was cancelled; don't leave work running
+            for task in tasks:
+                task.cancel()
+    
+    @staticmethod
+    def _format_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "response": result["response"],
+            "metadata": {
+                "agent": result.get("agent", "Consciousness Zero"),
+                "timestamp": result.get("timestamp"),
+                "intent": result.get("intent", {}),
+                "tools_used": result.get("tools_used", [])
+            }
+        }
 
 # Function registry for Open WebUI
 def get_openwebui_functions() -> List[Dict[str, Any]]:
@@ -89,9 +122,14 @@ def get_openwebui_functions() -> List[Dict[str, Any]]:
                         "type": "string", 
                         "description": "User identifier (optional)",
                         "default": "openwebui_user"
+                    },
+                    "messages": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Several messages to process concurrently; use instead of message"
                     }
                 },
-                "required": ["message"]
+                "anyOf": [{"required": ["message"]}, {"required": ["messages"]}]
             },
             "function": ConsciousnessOpenWebUIFunction()
         }
@@ -4,53 +4,376 @@ Ansible Orchestration Module - Full implementation with playbook management
 import subprocess
 import asyncio
 import yaml
-import json
+import orjson
 import os
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import tempfile
 import logging
+import uuid
+import shutil
+import time
+import hashlib
+import threading
+from collections import deque
+import aiofiles
+
+from app.orchestration.streaming import OUTPUT_TAIL_LINES, drain
 
 logger = logging.getLogger(__name__)
 
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:
+    INotify = None
+    logger.warning("inotify_simple not installed; playbook existence checks fall back to the filesystem")
+
+# Prefer the libyaml C bindings; the pure-Python ones are an order of magnitude slower
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 ANSIBLE_DIR = Path("/app/data/ansible")
 PLAYBOOKS_DIR = ANSIBLE_DIR / "playbooks"
 INVENTORIES_DIR = ANSIBLE_DIR / "inventories"
 ANSIBLE_DIR.mkdir(parents=True, exist_ok=True)
 PLAYBOOKS_DIR.mkdir(parents=True, exist_ok=True)
+LOGS_DIR = ANSIBLE_DIR / "logs"
 INVENTORIES_DIR.mkdir(parents=True, exist_ok=True)
+LOGS_DIR.mkdir(parents=True, exist_ok=True)
+FACT_CACHE_DIR = ANSIBLE_DIR / "fact_cache"
+FACT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Resolved once at import. Absolute executables with no preexec_fn let
+# CPython spawn via vfork/posix_spawn instead of a page-table-copying fork
+ANSIBLE_PLAYBOOK_BIN = shutil.which("ansible-playbook") or "ansible-playbook"
+ANSIBLE_BIN = shutil.which("ansible") or "ansible"
+
+# Spawned ansible processes (and the forks/ssh clients they start, which
+# inherit affinity) are pinned to the last few allowed cores so they stay
+# cache-warm instead of migrating across a large host. ANSIBLE_CPU_CORES
+# overrides the count; 0 disables pinning, as does a host under 8 CPUs.
+def _orchestration_cpus() -> frozenset:
+    if not hasattr(os, "sched_setaffinity"):
+        return frozenset()
+    allowed = sorted(os.sched_getaffinity(0))
+    count = int(os.getenv("ANSIBLE_CPU_CORES", min(4, len(allowed) // 4) if len(allowed) >= 8 else 0))
+    return frozenset(allowed[-count:]) if count > 0 else frozenset()
+
+ORCHESTRATION_CPUS = _orchestration_cpus()
+
+# Per-run logs in LOGS_DIR older than a week, or beyond the newest 1000, are
+# deleted; the directory is swept on the first run and every 100 runs after
+LOG_MAX_AGE = 7 * 24 * 3600
+LOG_MAX_FILES = 1000
+LOG_PRUNE_EVERY = 100
+
+# Opt-in memoization of successful playbook runs (e.g. repeated status probes)
+RESULT_CACHE_TTL = 60.0
+
+# Larger extra_vars go through a temp file (--extra-vars @file) rather than
+# argv, staying well clear of ARG_MAX / E2BIG
+EXTRA_VARS_ARGV_MAX = 100 * 1024
+
+# Performance defaults handed to every ansible/ansible-playbook process as
+# environment rather than an ansible.cfg on disk. Any of these can be
+# overridden by setting the same variable in the gateway's own environment.
+#  - SSH multiplexing: Ansible's default ssh_args with ControlPersist raised
+#    from 60s to 10 minutes, so later processes reuse the first run's
+#    ControlMaster socket (at Ansible's default control path) and skip the
+#    TCP and SSH handshakes; pipelining cuts the per-task round trips.
+#    Host key checking is left as configured by the inventory
+#  - Gathered facts are cached on disk for an hour and "smart" gathering
+#    skips hosts already in the cache
+ANSIBLE_ENV_DEFAULTS = {
+    "ANSIBLE_PIPELINING": "True",
+    "ANSIBLE_FORKS": "50",
+    "ANSIBLE_SSH_ARGS": "-C -o ControlMaster=auto -o ControlPersist=600s",
+    "ANSIBLE_GATHERING": "smart",
+    "ANSIBLE_CACHE_PLUGIN": "jsonfile",
+    "ANSIBLE_CACHE_PLUGIN_CONNECTION": str(FACT_CACHE_DIR),
+    "ANSIBLE_CACHE_PLUGIN_TIMEOUT": "3600",
+}
+ANSIBLE_ENV = {**ANSIBLE_ENV_DEFAULTS, **os.environ}
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+def _prune_logs() -> None:
+    """Delete per-run logs past LOG_MAX_AGE, then all but the newest LOG_MAX_FILES"""
+    cutoff = time.time() - LOG_MAX_AGE
+    logs = []
+    with os.scandir(LOGS_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith(".log"):
+                continue
+            try:
+                logs.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                continue
+    logs.sort(reverse=True)
+    for i, (mtime, path) in enumerate(logs):
+        if i >= LOG_MAX_FILES or mtime < cutoff:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+def _write_vars_file(payload: bytes) -> str:
+    """Write an encoded extra_vars payload to a private temp file and return its path"""
+    fd, path = tempfile.mkstemp(prefix="vars-", suffix=".json")
+    with os.fdopen(fd, 'wb') as f:
+        f.write(payload)
+    return path
 
 class AnsibleOrchestrator:
     def __init__(self):
         self.base_dir = ANSIBLE_DIR
         self.playbooks_dir = PLAYBOOKS_DIR
         self.inventories_dir = INVENTORIES_DIR
+        self.env = ANSIBLE_ENV
+        # String prefixes for resolving relative names without pathlib on every call
+        self._playbooks_str = str(PLAYBOOKS_DIR) + os.sep
+        self._inventories_str = str(INVENTORIES_DIR) + os.sep
+        # Parsed YAML by path, reused while the file's (mtime_ns, size) is unchanged
+        self._meta_cache: Dict[str, tuple] = {}
+        # _load_yaml and _scan_yaml_dir run in worker threads and both mutate it
+        self._meta_lock = threading.Lock()
+        # Successful cacheable run results by _result_key, as (expires_at, result)
+        self._result_cache: Dict[str, tuple] = {}
+        # One inotify watch over both directories, started on first use. It keeps
+        # the set of file names in PLAYBOOKS_DIR current and invalidates the
+        # list_inventories snapshot; both are None while not watching
+        self._inotify = None
+        self._inventories_wd = None
+        self._known_playbooks: Optional[set] = None
+        self._inventory_snapshot: Optional[List[Dict[str, Any]]] = None
+        self._inventory_generation = 0
+        self._watch_lock: Optional[asyncio.Lock] = None
+        # Runs left until LOGS_DIR is next pruned
+        self._runs_until_prune = 0
+        
+    def _load_yaml(self, path: str) -> Any:
+        """Parse a YAML file, returning the cached result if the file hasn't changed"""
+        st = os.stat(path)
+        cached = self._meta_cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with open(path, 'r') as f:
+            data = yaml.load(f, Loader=SafeLoader)
+        with self._meta_lock:
+            self._meta_cache[path] = (st.st_mtime_ns, st.st_size, data)
+        return data
+    
+    def _write_yaml(self, path: Path, data: Any) -> None:
+        """Dump data next to path and atomically swap it in, so readers never see a partial file"""
+        # Serialize up front so the file gets one buffer-sized write rather than
+        # a stream of small ones from the dumper
+        content = memoryview(yaml.dump(data, Dumper=SafeDumper, default_flow_style=False, indent=2).encode())
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            try:
+                # mkstemp creates 0600; keep the permissions a plain open() would give
+                os.fchmod(fd, 0o644)
+                while content:
+                    content = content[os.write(fd, content):]
+            finally:
+                os.close(fd)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+    
+    async def _watched_playbooks(self) -> Optional[set]:
+        """Return the inotify-maintained set of playbook file names, or None if unavailable"""
+        if self._inotify is None and INotify is not None:
+            # Constructed lazily: __init__ runs off the event loop at startup
+            if self._watch_lock is None:
+                self._watch_lock = asyncio.Lock()
+            async with self._watch_lock:
+                if self._inotify is None:
+                    await self._start_watching()
+        return self._known_playbooks
+    
+    async def _start_watching(self) -> None:
+        try:
+            inotify = INotify()
+            names = inotify_flags.CREATE | inotify_flags.DELETE | inotify_flags.MOVED_TO | inotify_flags.MOVED_FROM
+            inotify.add_watch(self._playbooks_str, names)
+            self._inventories_wd = inotify.add_watch(self._inventories_str, names | inotify_flags.CLOSE_WRITE)
+        except OSError as e:
+            logger.warning(f"Could not watch the playbook/inventory directories: {e}")
+            return
+        try:
+            # Listed in a worker thread after the watch is in place, so no change
+            # can slip between the two. Events meanwhile queue up on the inotify
+            # fd and are replayed over the listing once the reader is added
+            known = await asyncio.to_thread(self._scan_playbook_names)
+        except BaseException:
+            inotify.close()
+            raise
+        self._inotify = inotify
+        self._known_playbooks = known
+        asyncio.get_running_loop().add_reader(inotify.fileno(), self._on_watch_events)
+    
+    def _scan_playbook_names(self) -> set:
+        return {f["name"] + ".yml" for f in self._scan_yaml_dir(self.playbooks_dir)}
+    
+    def _stop_watching(self) -> None:
+        """Drop the watch and everything derived from it; the next lookup starts a fresh one"""
+        asyncio.get_running_loop().remove_reader(self._inotify.fileno())
+        self._inotify.close()
+        self._inotify = None
+        self._known_playbooks = None
+        self._inventory_snapshot = None
+        self._inventory_generation += 1
+    
+    def _on_watch_events(self) -> None:
+        for event in self._inotify.read(timeout=0):
+            if event.mask & (inotify_flags.IGNORED | inotify_flags.Q_OVERFLOW):
+                # A watched directory went away or events were dropped; stop
+                # trusting the cached state rather than rescanning on the loop
+                self._stop_watching()
+                return
+            if event.wd == self._inventories_wd:
+                self._inventory_snapshot = None
+                self._inventory_generation += 1
+            elif event.name.endswith(".yml") and not event.name.startswith("."):
+                if event.mask & (inotify_flags.CREATE | inotify_flags.MOVED_TO):
+                    self._known_playbooks.add(event.name)
+                else:
+                    self._known_playbooks.discard(event.name)
+    
+    def _result_key(self, playbook_path: str, inventory: Optional[str],
+                    extra_vars: Optional[Dict[str, Any]], tags: Optional[List[str]],
+                    limit: Optional[str]) -> str:
+        """Hash everything that determines a run's outcome, including file mtimes"""
+        h = hashlib.blake2b(digest_size=16)
+        for part in (playbook_path, _mtime_ns(playbook_path), inventory,
+                     _mtime_ns(inventory) if inventory else None,
+                     orjson.dumps(extra_vars, option=orjson.OPT_SORT_KEYS).decode(),
+                     ",".join(tags or ()), limit):
+            h.update(f"{part}|".encode())
+        return h.hexdigest()
+    
+    def _scan_yaml_dir(self, directory: Path) -> List[Dict[str, Any]]:
+        """List *.yml files in one directory pass and drop cache entries for removed files"""
+        files = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.startswith(".") or not entry.name.endswith(".yml") or not entry.is_file():
+                    continue
+                files.append({
+                    "name": entry.name[:-len(".yml")],
+                    "path": entry.path,
+                    "size": entry.stat().st_size
+                })
+        prefix = str(directory) + os.sep
+        present = {f["path"] for f in files}
+        with self._meta_lock:
+            for path in [p for p in list(self._meta_cache) if p.startswith(prefix) and p not in present]:
+                del self._meta_cache[path]
+        return files
+    
+    async def _run(self, cmd: List[str]) -> Dict[str, Any]:
+        """
+        Run an ansible command, streaming its full output to a per-run log file
+        in LOGS_DIR and keeping only the last OUTPUT_TAIL_LINES lines of each
+        stream in memory.
+        """
+        if self._runs_until_prune <= 0:
+            self._runs_until_prune = LOG_PRUNE_EVERY
+            try:
+                await asyncio.to_thread(_prune_logs)
+            except OSError as e:
+                logger.warning(f"Could not prune ansible run logs: {e}")
+        self._runs_until_prune -= 1
+        log_path = LOGS_DIR / f"{uuid.uuid4()}.log"
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.base_dir),
+            env=self.env
+        )
+        if ORCHESTRATION_CPUS:
+            try:
+                os.sched_setaffinity(process.pid, ORCHESTRATION_CPUS)
+            except OSError as e:
+                logger.debug("Could not pin ansible process %s: %s", process.pid, e)
+        stdout_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        stderr_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        async with aiofiles.open(log_path, 'ab') as log:
+            await asyncio.gather(
+                drain(process.stdout, stdout_tail, log),
+                drain(process.stderr, stderr_tail, log)
+            )
+        await process.wait()
         
+        return {
+            "command": cmd,
+            "returncode": process.returncode,
+            "stdout": b"\n".join(stdout_tail).decode(errors="replace"),
+            "stderr": b"\n".join(stderr_tail).decode(errors="replace"),
+            "log_path": str(log_path),
+            "status": "success" if process.returncode == 0 else "failed"
+        }
+    
     async def run_playbook(self, playbook_path: str, inventory: Optional[str] = None, 
                           extra_vars: Optional[Dict[str, Any]] = None, 
                           tags: Optional[List[str]] = None, 
-                          limit: Optional[str] = None) -> Dict[str, Any]:
-        """Run an Ansible playbook with full options"""
+                          limit: Optional[str] = None,
+                          forks: Optional[int] = None,
+                          cacheable: bool = False,
+                          force: bool = False) -> Dict[str, Any]:
+        """
+        Run an Ansible playbook with full options. With cacheable=True a
+        successful result is reused for RESULT_CACHE_TTL seconds while the
+        playbook, inventory and arguments are unchanged; force=True skips the
+        lookup but still refreshes the cache.
+        """
         try:
-            # Resolve playbook path
+            # Resolve playbook path; plain names found in the watched set skip
+            # the filesystem. A miss still stats the file, since another worker
+            # may have just created it and its event not been read yet
+            found = False
             if not os.path.isabs(playbook_path):
-                playbook_path = str(self.playbooks_dir / playbook_path)
+                known = await self._watched_playbooks()
+                found = known is not None and os.sep not in playbook_path and playbook_path in known
+                playbook_path = self._playbooks_str + playbook_path
             
-            if not os.path.exists(playbook_path):
+            if not (found or os.path.exists(playbook_path)):
                 return {"status": "error", "message": f"Playbook not found: {playbook_path}"}
             
             # Build command
-            cmd = ["ansible-playbook", playbook_path]
+            cmd = [ANSIBLE_PLAYBOOK_BIN, playbook_path]
             
             # Add inventory
             if inventory:
                 if not os.path.isabs(inventory):
-                    inventory = str(self.inventories_dir / inventory)
+                    inventory = self._inventories_str + inventory
                 cmd.extend(["-i", inventory])
             
+            cache_key = None
+            if cacheable:
+                cache_key = self._result_key(playbook_path, inventory, extra_vars, tags, limit)
+                cached = None if force else self._result_cache.get(cache_key)
+                if cached is not None and cached[0] > time.monotonic():
+                    return {**cached[1], "cached": True}
+            
             # Add extra vars
+            vars_file = None
             if extra_vars:
-                cmd.extend(["--extra-vars", json.dumps(extra_vars)])
+                payload = orjson.dumps(extra_vars)
+                if len(payload) > EXTRA_VARS_ARGV_MAX:
+                    vars_file = await asyncio.to_thread(_write_vars_file, payload)
+                    cmd.extend(["--extra-vars", f"@{vars_file}"])
+                else:
+                    cmd.extend(["--extra-vars", payload.decode()])
             
             # Add tags
             if tags:
@@ -60,65 +383,63 @@ class AnsibleOrchestrator:
             if limit:
                 cmd.extend(["--limit", limit])
             
+            # Add parallelism across hosts
+            if forks:
+                cmd.extend(["--forks", str(forks)])
+            
             # Add verbose output
             cmd.append("-v")
             
             # Execute
-            logger.info(f"Running Ansible command: {' '.join(cmd)}")
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(self.base_dir)
-            )
-            
-            stdout, stderr = await process.communicate()
-            
-            result = {
-                "command": " ".join(cmd),
-                "returncode": process.returncode,
-                "stdout": stdout.decode() if stdout else "",
-                "stderr": stderr.decode() if stderr else "",
-                "status": "success" if process.returncode == 0 else "failed"
-            }
+            logger.info("Running Ansible command: %s", cmd)
+            try:
+                result = await self._run(cmd)
+            finally:
+                if vars_file:
+                    os.unlink(vars_file)
             
+            if cache_key and result["returncode"] == 0:
+                now = time.monotonic()
+                for key in [k for k, (expires, _) in self._result_cache.items() if expires <= now]:
+                    del self._result_cache[key]
+                self._result_cache[cache_key] = (now + RESULT_CACHE_TTL, result)
             return result
             
         except Exception as e:
             logger.error(f"Ansible playbook execution failed: {e}")
             return {"status": "error", "message": str(e)}
     
+    async def run_playbooks_batch(self, requests: List[Dict[str, Any]], max_concurrency: int = 10) -> List[Dict[str, Any]]:
+        """
+        Run several playbooks concurrently, at most max_concurrency at a time.
+        Each request takes run_playbook's keyword arguments; results come back
+        in request order. Forks stay at ANSIBLE_FORKS unless a request sets
+        its own.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded(request: Dict[str, Any]) -> Dict[str, Any]:
+            async with sem:
+                return await self.run_playbook(**request)
+        
+        return await asyncio.gather(*(bounded(r) for r in requests))
+    
     async def run_adhoc(self, hosts: str, module: str, args: str = "", 
                        inventory: Optional[str] = None) -> Dict[str, Any]:
         """Run ad-hoc Ansible command"""
         try:
-            cmd = ["ansible", hosts, "-m", module]
+            cmd = [ANSIBLE_BIN, hosts, "-m", module]
             
             if args:
                 cmd.extend(["-a", args])
             
             if inventory:
                 if not os.path.isabs(inventory):
-                    inventory = str(self.inventories_dir / inventory)
+                    inventory = self._inventories_str + inventory
                 cmd.extend(["-i", inventory])
             
-            logger.info(f"Running Ansible ad-hoc: {' '.join(cmd)}")
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(self.base_dir)
-            )
-            
-            stdout, stderr = await process.communicate()
-            
-            return {
-                "command": " ".join(cmd),
-                "returncode": process.returncode,
-                "stdout": stdout.decode() if stdout else "",
-                "stderr": stderr.decode() if stderr else "",
-                "status": "success" if process.returncode == 0 else "failed"
-            }
+            logger.info("Running Ansible ad-hoc: %s", cmd)
+            return await self._run(cmd)
             
         except Exception as e:
             logger.error(f"Ansible ad-hoc execution failed: {e}")
@@ -130,8 +451,7 @@ class AnsibleOrchestrator:
             playbook_content = plays
             playbook_path = self.playbooks_dir / f"{name}.yml"
             
-            with open(playbook_path, 'w') as f:
-                yaml.dump(playbook_content, f, default_flow_style=False, indent=2)
+            await asyncio.to_thread(self._write_yaml, playbook_path, playbook_content)
             
             return {
                 "status": "success",
@@ -148,8 +468,7 @@ class AnsibleOrchestrator:
         try:
             inventory_path = self.inventories_dir / f"{name}.yml"
             
-            with open(inventory_path, 'w') as f:
-                yaml.dump(inventory_data, f, default_flow_style=False, indent=2)
+            await asyncio.to_thread(self._write_yaml, inventory_path, inventory_data)
             
             return {
                 "status": "success",
@@ -164,15 +483,7 @@ class AnsibleOrchestrator:
     async def list_playbooks(self) -> Dict[str, Any]:
         """List all available playbooks"""
         try:
-            playbooks = []
-            for playbook_file in self.playbooks_dir.glob("*.yml"):
-                playbooks.append({
-                    "name": playbook_file.stem,
-                    "path": str(playbook_file),
-                    "size": playbook_file.stat().st_size
-                })
-            
-            return {"status": "success", "playbooks": playbooks}
+            return {"status": "success", "playbooks": await asyncio.to_thread(self._scan_yaml_dir, self.playbooks_dir)}
             
         except Exception as e:
             logger.error(f"Failed to list playbooks: {e}")
@@ -181,19 +492,41 @@ class AnsibleOrchestrator:
     async def list_inventories(self) -> Dict[str, Any]:
         """List all available inventories"""
         try:
-            inventories = []
-            for inventory_file in self.inventories_dir.glob("*.yml"):
-                inventories.append({
-                    "name": inventory_file.stem,
-                    "path": str(inventory_file),
-                    "size": inventory_file.stat().st_size
-                })
-            
-            return {"status": "success", "inventories": inventories}
+            # Served from memory while the watch reports no changes to the directory
+            watching = await self._watched_playbooks() is not None
+            if watching and self._inventory_snapshot is not None:
+                return {"status": "success", "inventories": list(self._inventory_snapshot)}
+            generation = self._inventory_generation
+            inventories = await asyncio.to_thread(self._scan_yaml_dir, self.inventories_dir)
+            if watching and generation == self._inventory_generation:
+                self._inventory_snapshot = inventories
+            return {"status": "success", "inventories": list(inventories)}
             
         except Exception as e:
             logger.error(f"Failed to list inventories: {e}")
             return {"status": "error", "message": str(e)}
+    
+    async def get_playbook(self, name: str) -> Dict[str, Any]:
+        """Return a playbook's parsed plays"""
+        try:
+            return {"status": "success", "plays": await asyncio.to_thread(self._load_yaml, f"{self._playbooks_str}{name}.yml")}
+            
+        except FileNotFoundError:
+            return {"status": "error", "message": f"Playbook not found: {name}"}
+        except Exception as e:
+            logger.error(f"Failed to load playbook: {e}")
+            return {"status": "error", "message": str(e)}
+    
+    async def get_inventory(self, name: str) -> Dict[str, Any]:
+        """Return an inventory's parsed contents"""
+        try:
+            return {"status": "success", "inventory": await asyncio.to_thread(self._load_yaml, f"{self._inventories_str}{name}.yml")}
+            
+        except FileNotFoundError:
+            return {"status": "error", "message": f"Inventory not found: {name}"}
+        except Exception as e:
+            logger.error(f"Failed to load inventory: {e}")
+            return {"status": "error", "message": str(e)}
 
 # Global orchestrator instance
 ansible_orchestrator = AnsibleOrchestrator()
@@ -202,8 +535,14 @@ ansible_orchestrator = AnsibleOrchestrator()
 async def run_ansible_playbook(playbook_path: str, inventory: Optional[str] = None, 
                               extra_vars: Optional[Dict[str, Any]] = None, 
                               tags: Optional[List[str]] = None, 
-                              limit: Optional[str] = None):
-    return await ansible_orchestrator.run_playbook(playbook_path, inventory, extra_vars, tags, limit)
+                              limit: Optional[str] = None,
+                              cacheable: bool = False,
+                              force: bool = False):
+    return await ansible_orchestrator.run_playbook(playbook_path, inventory, extra_vars, tags, limit,
+                                                   cacheable=cacheable, force=force)
+
+async def run_ansible_playbooks_batch(requests: List[Dict[str, Any]], max_concurrency: int = 10):
+    return await ansible_orchestrator.run_playbooks_batch(requests, max_concurrency)
 
 async def run_ansible_adhoc(hosts: str, module: str, args: str = "", inventory: Optional[str] = None):
     return await ansible_orchestrator.run_adhoc(hosts, module, args, inventory)
@@ -219,3 +558,9 @@ async def list_ansible_playbooks():
 
 async def list_ansible_inventories():
     return await ansible_orchestrator.list_inventories()
+
+async def get_ansible_playbook(name: str):
+    return await ansible_orchestrator.get_playbook(name)
+
+async def get_ansible_inventory(name: str):
+    return await ansible_orchestrator.get_inventory(name)
@@ -1,8 +1,46 @@
 """
 Bash Orchestration Module
 """
-import subprocess
+import asyncio
+import shutil
+from collections import deque
+from functools import lru_cache
+from typing import List, Union
 
-def run_bash_command(command):
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
-    return {"stdout": result.stdout, "stderr": result.stderr, "returncode": result.returncode}
+from app.orchestration.streaming import OUTPUT_TAIL_LINES, drain
+
+BASH_TIMEOUT = 60
+
+@lru_cache(maxsize=256)
+def _resolve(program: str) -> str:
+    # An absolute path (and no preexec_fn) keeps CPython on its vfork/posix_spawn fast path
+    return shutil.which(program) or program
+
+async def run_bash_command(command: Union[str, List[str]], timeout: float = BASH_TIMEOUT):
+    # An argv list is exec'd directly; only a plain string goes through /bin/sh
+    if isinstance(command, str):
+        process = await asyncio.create_subprocess_shell(
+            command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    elif not command:
+        return {"stdout": "", "stderr": "Empty command", "returncode": 1}
+    else:
+        process = await asyncio.create_subprocess_exec(
+            _resolve(command[0]), *command[1:], stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    stdout = deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr = deque(maxlen=OUTPUT_TAIL_LINES)
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(drain(process.stdout, stdout), drain(process.stderr, stderr), process.wait()),
+            timeout=timeout
+        )
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        stderr.append(f"Command timed out after {timeout}s".encode())
+    return {
+        "stdout": b"\n".join(stdout).decode(errors="replace"),
+        "stderr": b"\n".join(stderr).decode(errors="replace"),
+        "returncode": process.returncode
+    }
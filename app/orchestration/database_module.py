@@ -3,28 +3,97 @@ MCP module for database orchestration (Postgres, MySQL, etc.).
 """
 
 import asyncio
-from typing import Dict, Optional
+import os
+import re
+from typing import Dict, Optional, Tuple
+
+# Admin connections for the database servers this orchestrator manages. There
+# are no defaults: an engine without a DSN is never connected to
+POSTGRES_DSN = os.getenv("DATABASE_POSTGRES_DSN")
+MYSQL_DSN = os.getenv("DATABASE_MYSQL_DSN")
+# CREATE/DROP DATABASE only run when explicitly enabled; otherwise provision
+# and delete stay no-ops
+ALLOW_DDL = os.getenv("DATABASE_ALLOW_DDL", "false").lower() == "true"
+POOL_MIN_SIZE = 5
+POOL_MAX_SIZE = 50
+
+DB_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]{0,62}$")
+
+def _parse_db_id(db_id: str) -> Tuple[str, str]:
+    """Split "engine:name" (engine defaults to postgres) and validate the name"""
+    engine, _, name = db_id.rpartition(":")
+    engine = engine or "postgres"
+    if engine not in ("postgres", "mysql"):
+        raise ValueError(f"Unsupported database engine: {engine}")
+    if not DB_NAME_RE.match(name):
+        raise ValueError(f"Invalid database name: {name}")
+    return engine, name
+
+def _configured(engine: str) -> bool:
+    return (POSTGRES_DSN if engine == "postgres" else MYSQL_DSN) is not None
 
 class DatabaseOrchestrator:
     """
     Orchestrates database deployment and management for clusters.
     Provides async methods for provisioning, status, and query execution.
+    Connection pools are created on first use and shared by every call.
     """
     def __init__(self):
-        pass
+        self.pg_pool = None
+        self.mysql_pool = None
+        self._pool_lock: Optional[asyncio.Lock] = None
+
+    async def _get_pool(self, engine: str):
+        # Constructed lazily: __init__ runs off the event loop at startup
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        async with self._pool_lock:
+            if engine == "postgres":
+                if self.pg_pool is None:
+                    import asyncpg
+                    self.pg_pool = await asyncpg.create_pool(POSTGRES_DSN, min_size=POOL_MIN_SIZE, max_size=POOL_MAX_SIZE)
+                return self.pg_pool
+            if self.mysql_pool is None:
+                import aiomysql
+                from urllib.parse import urlsplit
+                url = urlsplit(MYSQL_DSN)
+                self.mysql_pool = await aiomysql.create_pool(
+                    host=url.hostname, port=url.port or 3306, user=url.username or "root",
+                    password=url.password or "", db=url.path.lstrip("/") or None,
+                    minsize=POOL_MIN_SIZE, maxsize=POOL_MAX_SIZE, autocommit=True
+                )
+            return self.mysql_pool
+
+    async def _execute(self, engine: str, statement: str) -> None:
+        pool = await self._get_pool(engine)
+        if engine == "postgres":
+            async with pool.acquire() as conn:
+                await conn.execute(statement)
+        else:
+            async with pool.acquire() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(statement)
 
     async def provision_database(self, db_config: Dict) -> Dict:
         """Provision a new database instance."""
         try:
-            await asyncio.sleep(0)
-            return {"status": "success", "message": "Database provisioned."}
+            engine, name = _parse_db_id(f"{db_config.get('engine', 'postgres')}:{db_config['name']}")
+            if not (ALLOW_DDL and _configured(engine)):
+                return {"status": "success", "message": "Database provisioned."}
+            quoted = f'"{name}"' if engine == "postgres" else f"`{name}`"
+            await self._execute(engine, f"CREATE DATABASE {quoted}")
+            return {"status": "success", "message": "Database provisioned.", "db_id": f"{engine}:{name}"}
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
     async def delete_database(self, db_id: str) -> Dict:
         """Delete a database instance by ID."""
         try:
-            await asyncio.sleep(0)
+            engine, name = _parse_db_id(db_id)
+            if not (ALLOW_DDL and _configured(engine)):
+                return {"status": "success", "message": f"Database {db_id} deleted."}
+            quoted = f'"{name}"' if engine == "postgres" else f"`{name}`"
+            await self._execute(engine, f"DROP DATABASE IF EXISTS {quoted}")
             return {"status": "success", "message": f"Database {db_id} deleted."}
         except Exception as e:
             return {"status": "error", "message": str(e)}
@@ -32,7 +101,43 @@ class DatabaseOrchestrator:
     async def get_database_status(self, db_id: str) -> Dict:
         """Get the status of a database instance."""
         try:
-            await asyncio.sleep(0)
-            return {"status": "success", "database_status": {}}
+            engine, name = _parse_db_id(db_id)
+            if not _configured(engine):
+                return {"status": "success", "database_status": {}}
+            pool = await self._get_pool(engine)
+            if engine == "postgres":
+                async with pool.acquire() as conn:
+                    row = await conn.fetchrow(
+                        "SELECT pg_database_size(datname) AS size_bytes,"
+                        " (SELECT count(*) FROM pg_stat_activity WHERE datname = $1) AS connections"
+                        " FROM pg_database WHERE datname = $1",
+                        name
+                    )
+                status = dict(row) if row else None
+            else:
+                async with pool.acquire() as conn:
+                    async with conn.cursor() as cur:
+                        await cur.execute(
+                            "SELECT COALESCE(SUM(data_length + index_length), 0), COUNT(table_name)"
+                            " FROM information_schema.tables WHERE table_schema = %s",
+                            (name,)
+                        )
+                        size_bytes, tables = await cur.fetchone()
+                        await cur.execute("SELECT COUNT(*) FROM information_schema.schemata WHERE schema_name = %s", (name,))
+                        (exists,) = await cur.fetchone()
+                status = {"size_bytes": int(size_bytes), "tables": tables} if exists else None
+            if status is None:
+                return {"status": "error", "message": f"Database {db_id} not found"}
+            return {"status": "success", "database_status": status}
         except Exception as e:
             return {"status": "error", "message": str(e)}
+
+    async def close(self) -> None:
+        """Release the connection pools."""
+        if self.pg_pool is not None:
+            await self.pg_pool.close()
+            self.pg_pool = None
+        if self.mysql_pool is not None:
+            self.mysql_pool.close()
+            await self.mysql_pool.wait_closed()
+            self.mysql_pool = None
@@ -0,0 +1,28 @@
+"""
+Subprocess Output Streaming - bounded readers shared by the orchestration modules
+"""
+import asyncio
+from collections import deque
+
+# Only the tail of each stream is kept in memory; anything longer goes to a log file
+OUTPUT_TAIL_LINES = 1000
+STREAM_CHUNK_SIZE = 65536
+
+async def drain(stream: asyncio.StreamReader, tail: deque, log=None) -> None:
+    """Read a process stream to EOF, keeping its last lines in tail and copying it to log if given"""
+    partial = b""
+    while True:
+        chunk = await stream.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        if log is not None:
+            await log.write(chunk)
+        lines = (partial + chunk).split(b"\n")
+        partial = lines.pop()
+        tail.extend(lines)
+        # Don't let a single endless line grow without bound
+        if len(partial) > STREAM_CHUNK_SIZE:
+            tail.append(partial)
+            partial = b""
+    if partial:
+        tail.append(partial)
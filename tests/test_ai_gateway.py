@@ -0,0 +1,75 @@
+"""
+Upstream failure handling in the gateway: fallbacks and circuit breakers
+"""
+
+import httpx
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import app.ai_gateway as gw
+
+FALLBACK_URL = "http://embeddings-fallback:5004"
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(gw, "_breakers", {})
+    saved = list(gw.EMBED_FALLBACKS)
+    with TestClient(gw.app) as c:
+        yield c
+    gw.EMBED_FALLBACKS[:] = saved
+
+class _Body(httpx.AsyncByteStream):
+    def __init__(self, data: bytes):
+        self.data = data
+
+    async def __aiter__(self):
+        yield self.data
+
+def _patch_send(monkeypatch, client, failing_hosts):
+    """Make client.send raise for failing_hosts and answer 200 for everything else"""
+    calls = []
+    async def send(request, **kwargs):
+        calls.append(request.url.host)
+        if request.url.host in failing_hosts:
+            raise httpx.ConnectError("connection refused", request=request)
+        body = _Body(orjson.dumps({"host": request.url.host}))
+        return httpx.Response(200, stream=body, headers={"content-type": "application/json"}, request=request)
+    monkeypatch.setattr(client.app.state.http, "send", send)
+    return calls
+
+def test_upstream_error_falls_back(client, monkeypatch):
+    gw.EMBED_FALLBACKS[:] = [FALLBACK_URL]
+    calls = _patch_send(monkeypatch, client, {"embeddings"})
+    resp = client.post("/v1/embeddings", json={"input": "x"})
+    assert resp.status_code == 200
+    assert resp.json() == {"host": "embeddings-fallback"}
+    assert calls == ["embeddings", "embeddings-fallback"]
+
+def test_all_upstreams_failing_returns_503(client, monkeypatch):
+    gw.EMBED_FALLBACKS[:] = []
+    _patch_send(monkeypatch, client, {"embeddings"})
+    resp = client.post("/v1/embeddings", json={"input": "x"})
+    assert resp.status_code == 503
+
+def test_breaker_opens_and_skips_upstream(client, monkeypatch):
+    gw.EMBED_FALLBACKS[:] = []
+    calls = _patch_send(monkeypatch, client, {"embeddings"})
+    for _ in range(gw.BREAKER_TRIP_FAILURES):
+        assert client.post("/v1/embeddings", json={"input": "x"}).status_code == 503
+    assert gw._breaker_for(gw.EMBED_URL).state == "open"
+    resp = client.post("/v1/embeddings", json={"input": "x"})
+    assert resp.status_code == 503
+    assert len(calls) == gw.BREAKER_TRIP_FAILURES
+
+def test_half_open_admits_a_single_trial():
+    breaker = gw.BreakerState()
+    for _ in range(gw.BREAKER_TRIP_FAILURES):
+        breaker.record_failure()
+    breaker.opened_at -= gw.BREAKER_RESET_TIMEOUT
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow() and breaker.allow()